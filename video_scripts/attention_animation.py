@@ -1,8 +1,50 @@
 import numpy as np
 from manim import *
 
+from attention_weights import (
+    check_heads,
+    random_attention_inputs,
+    scaled_dot_product_attention,
+)
+from components import attention_head
+from heatmap import Heatmap
+
 
 class AttentionMechanism(Scene):
+    # Override in a subclass to visualise other inputs; embeddings and the
+    # weight matrices default to seeded random ones of size d_model
+    tokens = "The cat sat on the mat because it was warm".split()
+    d_model = 64
+    heads = 4
+    embeddings = None
+    w_q = w_k = w_v = None
+    seed = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        d_model = self.d_model
+        if self.embeddings is not None:
+            d_model = np.shape(self.embeddings)[1]
+        check_heads(d_model, self.heads)
+
+    def attention_weights(self):
+        d_model = self.d_model
+        if self.embeddings is not None:
+            d_model = np.shape(self.embeddings)[1]
+        embeddings, w_q, w_k, w_v = random_attention_inputs(
+            len(self.tokens), d_model, self.seed
+        )
+        if self.embeddings is not None:
+            embeddings = np.asarray(self.embeddings, dtype=float)
+        weights, _ = scaled_dot_product_attention(
+            embeddings,
+            w_q if self.w_q is None else np.asarray(self.w_q, dtype=float),
+            w_k if self.w_k is None else np.asarray(self.w_k, dtype=float),
+            w_v if self.w_v is None else np.asarray(self.w_v, dtype=float),
+            self.heads,
+        )
+        return weights
+
     def construct(self):
         # Configuration
         token_color = "#2ecc71"
@@ -124,28 +166,25 @@ class AttentionMechanism(Scene):
         attention_matrix = Rectangle(
             height=1.0,
             width=1.0,  # Slightly smaller
-            fill_color="#9b59b6",
-            fill_opacity=0.3,
             stroke_color=WHITE,
         ).move_to(
             LEFT * 3 + UP * 0
         )  # Moved left and kept vertical position
 
-        matrix_grid = VGroup(
+        # Real attention weights, one image per head stacked behind the first
+        weights = self.attention_weights()
+        attention_heatmaps = Group(
             *[
-                Line(
-                    start=attention_matrix.get_corner(UL) + RIGHT * i / 3 * 1.0,
-                    end=attention_matrix.get_corner(DL) + RIGHT * i / 3 * 1.0,
-                )
-                for i in range(4)
-            ]
-            + [
-                Line(
-                    start=attention_matrix.get_corner(UL) + DOWN * i / 3 * 1.0,
-                    end=attention_matrix.get_corner(UR) + DOWN * i / 3 * 1.0,
-                )
-                for i in range(4)
-            ]
+                Heatmap(
+                    head_weights,
+                    height=1.0,
+                    width=1.0,
+                    colors=[BLACK, "#9b59b6", WHITE],
+                    vmin=0,
+                    vmax=weights.max(),
+                ).move_to(attention_matrix.get_center() + (UR * 0.08 * i))
+                for i, head_weights in enumerate(weights)
+            ][::-1]
         )
 
         attention_label = Text("Attention\nScores", font_size=20).next_to(
@@ -170,8 +209,8 @@ class AttentionMechanism(Scene):
         # Then show attention calculation
         self.play(
             Write(attention_explanation),
+            FadeIn(attention_heatmaps),
             Create(attention_matrix),
-            Create(matrix_grid),
             Write(attention_label),
             Create(attention_arrows),
             run_time=1.5,
@@ -199,9 +238,11 @@ class AttentionMechanism(Scene):
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         softmax_technical.to_edge(LEFT).shift(DOWN * 2)  # Move to bottom left
 
-        # Softmax visualization as probability distribution
-        prob_values = [0.45, 0.25, 0.15, 0.10, 0.05]  # Example probability distribution
-        max_width = 1.2
+        # Softmax visualization: the five largest weights of the first query
+        first_row = weights[0, 0]
+        top = np.argsort(first_row)[::-1][:5]
+        prob_values = first_row[top]
+        max_width = 1.2 / prob_values[0]
 
         softmax = VGroup(
             *[
@@ -213,11 +254,13 @@ class AttentionMechanism(Scene):
                         fill_opacity=0.8,
                         stroke_width=1,
                     ),
-                    Text(f"{prob:.2f}", font_size=16, color=WHITE).next_to(
+                    Text(
+                        f"{self.tokens[i]} {prob:.2f}", font_size=16, color=WHITE
+                    ).next_to(
                         Rectangle(height=0.2, width=max_width * prob), RIGHT, buff=0.1
                     ),
                 ).arrange(RIGHT, buff=0)
-                for prob in prob_values
+                for i, prob in zip(top, prob_values)
             ]
         ).arrange(DOWN, buff=0.1)
 
@@ -343,6 +386,16 @@ class AttentionMechanism(Scene):
 
 
 class MultiHeadAttention(Scene):
+    # Override in a subclass, e.g. heads = 12 for a GPT-2 sized layer
+    heads = 4
+    d_model = 512
+    # Above this many heads the middle ones are summarised by a single row
+    max_drawn_heads = 8
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        check_heads(self.d_model, self.heads)
+
     def construct(self):
         # Create black background
         bg = Rectangle(
@@ -384,69 +437,58 @@ class MultiHeadAttention(Scene):
         self.play(Create(input_token), Write(input_label))
 
         # Create multiple attention heads with better visualization
-        heads = 4
-        head_colors = ["#FF5733", "#33FF57", "#3357FF", "#FF33F5"]
-
-        # Create mini attention mechanisms for each head
-        def create_attention_head(color, index, total):
-            y_offset = (total - 1) / 2 - index  # For vertical staggering
-            head_group = VGroup()
-
-            # Q, K, V boxes
-            qkv = VGroup(
-                *[
-                    Rectangle(height=0.4, width=0.3, color=color, fill_opacity=0.3)
-                    for _ in range(3)
-                ]
-            ).arrange(RIGHT, buff=0.2)
-            qkv.move_to(LEFT * 2 + UP * y_offset)
-
-            # Labels
-            labels = VGroup(
-                *[
-                    Text(t, font_size=14, color=color).next_to(box, UP, buff=0.1)
-                    for t, box in zip(["Q", "K", "V"], qkv)
-                ]
-            )
-
-            # Attention box
-            att_box = Rectangle(height=0.6, width=0.6, color=color, fill_opacity=0.2)
-            att_box.next_to(qkv, RIGHT, buff=1)
-            att_label = Text(f"Head {index+1}", font_size=16, color=color).next_to(
-                att_box, UP
-            )
-
-            # Arrows
-            input_arrows = VGroup(
-                *[
-                    Arrow(
-                        input_token.get_right(),
-                        box.get_left(),
-                        color=color,
-                        stroke_width=2,
-                    )
-                    for box in qkv
-                ]
-            )
-
-            att_arrow = Arrow(
-                qkv[0].get_right(), att_box.get_left(), color=color, stroke_width=2
-            )
-
-            head_group.add(qkv, labels, att_box, att_label, input_arrows, att_arrow)
-            return head_group, att_box
-
-        # Create and position all heads
+        heads = self.heads
+        head_colors = [
+            ManimColor.from_hsv(((0.03 + i / heads) % 1, 0.8, 1)) for i in range(heads)
+        ]
+
+        # Draw every head if they fit, otherwise the first few, a summary row
+        # and the last head
+        if heads <= self.max_drawn_heads:
+            drawn = list(range(heads))
+        else:
+            drawn = list(range(self.max_drawn_heads - 2)) + [None, heads - 1]
+
+        # Rows share the space between the title and the bottom edge
+        spacing = min(1.0, 5.0 / len(drawn))
+        rows_top = (len(drawn) - 1) / 2 * spacing
+
+        # Create and position all heads in one pass
         attention_heads = VGroup()
         output_boxes = []
-        for i in range(heads):
-            head_group, out_box = create_attention_head(head_colors[i], i, heads)
+        output_colors = []
+        for row, i in enumerate(drawn):
+            position = LEFT * 2 + UP * (rows_top - row * spacing)
+            if i is None:
+                hidden = heads - len(drawn) + 1
+                attention_heads.add(
+                    Text(f"⋮ {hidden} more heads", font_size=16, color="#888888")
+                    .scale(max(spacing, 0.6))
+                    .move_to(position + RIGHT)
+                )
+                continue
+            head_group, out_box = attention_head(
+                head_colors[i],
+                f"Head {i+1}",
+                input_token.get_right(),
+                position,
+                scale=spacing,
+            )
             attention_heads.add(head_group)
             output_boxes.append(out_box)
+            output_colors.append(head_colors[i])
 
-        # Show parallel processing with staggered animation
-        for head in attention_heads:
-            self.play(Create(head), run_time=0.75)
+        # Show parallel processing with one staggered animation
+        self.play(
+            LaggedStart(
+                *[
+                    Create(head) if isinstance(head, VGroup) else Write(head)
+                    for head in attention_heads
+                ],
+                lag_ratio=0.25,
+            ),
+            run_time=min(3, 0.75 * len(attention_heads)),
+        )
         self.wait(2)
 
         # Technical explanation
@@ -466,17 +508,22 @@ class MultiHeadAttention(Scene):
         # Concatenation visualization
         concat = Rectangle(height=2, width=1.2, color="#e67e22", fill_opacity=0.3)
         concat.next_to(
-            output_boxes[1], RIGHT, buff=1.5
+            VGroup(*output_boxes), RIGHT, buff=1.5
         )  # Position relative to middle heads
         concat_label = Text("Concatenate", font_size=20, color="#e67e22").next_to(
             concat, UP
         )
+        concat_dims = Text(
+            f"{heads} × {self.d_model // heads} = {self.d_model}",
+            font_size=16,
+            color="#888888",
+        ).next_to(concat, DOWN)
 
         # Animated concatenation arrows
         concat_arrows = VGroup(
             *[
-                Arrow(box.get_right(), concat.get_left(), color=head_colors[i])
-                for i, box in enumerate(output_boxes)
+                Arrow(box.get_right(), concat.get_left(), color=color)
+                for box, color in zip(output_boxes, output_colors)
             ]
         )
 
@@ -484,18 +531,24 @@ class MultiHeadAttention(Scene):
             FadeOut(head_explanation),
             Create(concat),
             Write(concat_label),
+            Write(concat_dims),
             *[GrowArrow(arrow) for arrow in concat_arrows],
             run_time=1.5,
         )
 
         # Concatenation explanation
+        subscript = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+        names = [f"Head{str(i + 1).translate(subscript)}" for i in range(heads)]
+        if heads > 4:
+            names = names[:2] + ["…", names[-1]]
+        head_list = "[" + "; ".join(names) + "]"
         concat_explanation = VGroup(
             Text("Concatenation:", color="#ffffff", font_size=24),
             Text("• Combine all head outputs", font_size=20, color="#888888"),
             Text(
                 "• Preserve information from all heads", font_size=20, color="#888888"
             ),
-            Text("• [Head₁; Head₂; Head₃; Head₄]", font_size=20, color="#888888"),
+            Text(f"• {head_list}", font_size=20, color="#888888"),
         ).arrange(DOWN, aligned_edge=RIGHT)
         concat_explanation.to_edge(RIGHT).shift(DOWN)
 
@@ -0,0 +1,43 @@
+import numpy as np
+
+
+def softmax(x, axis=-1):
+    # Subtract the max first so exp() cannot overflow
+    e = np.exp(x - x.max(axis=axis, keepdims=True))
+    return e / e.sum(axis=axis, keepdims=True)
+
+
+def check_heads(d_model, heads):
+    if heads < 1 or d_model % heads:
+        raise ValueError(
+            f"d_model ({d_model}) must be a multiple of the number of heads ({heads})"
+        )
+
+
+def random_attention_inputs(n_tokens, d_model, seed=0):
+    """Seeded embeddings and Q/K/V projections with the usual 1/sqrt(d) scale."""
+    rng = np.random.default_rng(seed)
+    embeddings = rng.standard_normal((n_tokens, d_model))
+    w_q, w_k, w_v = rng.standard_normal((3, d_model, d_model)) / np.sqrt(d_model)
+    return embeddings, w_q, w_k, w_v
+
+
+def scaled_dot_product_attention(embeddings, w_q, w_k, w_v, heads=1):
+    """Multi-head self-attention over a whole sequence in a few matrix products.
+
+    Returns ``(weights, output)``: the softmax attention weights with shape
+    (heads, n_tokens, n_tokens) and the concatenated head outputs with shape
+    (n_tokens, d_model).
+    """
+    n, d_model = embeddings.shape
+    check_heads(d_model, heads)
+    d_k = d_model // heads
+
+    def split_heads(w):
+        # (n, d_model) -> (heads, n, d_k)
+        return (embeddings @ w).reshape(n, heads, d_k).transpose(1, 0, 2)
+
+    q, k, v = split_heads(w_q), split_heads(w_k), split_heads(w_v)
+    weights = softmax(q @ k.transpose(0, 2, 1) / np.sqrt(d_k))
+    output = (weights @ v).transpose(1, 0, 2).reshape(n, heads * d_k)
+    return weights, output
@@ -1,154 +1,241 @@
 from manim import *
 import numpy as np
 
+from edge_bundle import EdgeBundle
+
+# Colours for the repeated words, in order of first appearance
+MERGE_COLORS = [RED, ORANGE, YELLOW, PURPLE, TEAL, PINK, GREEN, BLUE]
+
+
+def snake_layout(n, rows=None, min_cols=6):
+    # Calculate positions in a snake-like pattern for all words at once
+    if rows is None:
+        aspect = config.frame_height / config.frame_width
+        rows = max(4, int(np.ceil(np.sqrt(n * aspect))))
+    cols = max(n // rows + 1, min_cols)
+
+    # Calculate spacing
+    x_spacing = config.frame_width * 0.8 / (cols - 1)  # 10% margin on each side
+    y_spacing = config.frame_height * 0.6 / (rows - 1)  # 20% margin on top/bottom
+
+    # Starting position (top-left)
+    start_x = -config.frame_width * 0.4  # Start 40% from left edge
+    start_y = config.frame_height * 0.3  # Start 30% from top
+
+    row, col = np.divmod(np.arange(n), cols)
+    # Alternate direction for each row
+    col = np.where(row % 2 == 0, col, cols - 1 - col)
+
+    positions = np.zeros((n, 3))
+    positions[:, 0] = start_x + col * x_spacing
+    positions[:, 1] = start_y - row * y_spacing
+    return positions, min(x_spacing, y_spacing)
+
+
+def build_word_graph(words, positions):
+    # Merge every repeated word into one node at the centre of its occurrences
+    keys = np.array([word.lower() for word in words])
+    _, first_index, token_node, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    token_node = token_node.reshape(-1)
+    node_positions = np.zeros((len(counts), 3))
+    np.add.at(node_positions, token_node, positions)
+    node_positions /= counts[:, None]
+
+    # Deduplicated bigram edges between the merged nodes (self-loops dropped)
+    pairs = np.stack([token_node[:-1], token_node[1:]], axis=1)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    edges = np.unique(pairs, axis=0)
+    return first_index, token_node, node_positions, counts, edges
+
+
+def node_arrow(start, end, start_radius, end_radius):
+    # Arrow from the rim of one node to the rim of the next
+    direction = end - start
+    unit_vector = direction / np.linalg.norm(direction)
+    return Arrow(
+        start + unit_vector * start_radius,
+        end - unit_vector * end_radius,
+        buff=0,
+        max_tip_length_to_length_ratio=0.15,
+        stroke_width=2,  # Thinner arrows
+    )
+
+
 class TextAnimation(Scene):
+    # Override in a subclass (e.g. with a whole paragraph) to show a larger graph
+    text = "Early one morning the sun was shining I was laying in bed Wondering if she had changed at all if her hair was still red"
+
+    # Above this many words, nodes are point-cloud dots and edges one EdgeBundle
+    max_detailed_words = 120
+    # Nodes smaller than this, or outside the frame, are drawn as dots too
+    min_detail_radius = 0.12
+
     def construct(self):
-        # Initialize text
-        text = "Early one morning the sun was shining I was laying in bed Wondering if she had changed at all if her hair was still red"
-        words = text.split()
-
-        # Calculate positions in a snake-like pattern
-        positions = []
-        rows = 4  # Number of rows
-        cols = max(len(words) // rows + 1, 6)  # Minimum 6 columns
-        
-        # Calculate spacing
-        x_spacing = config.frame_width * 0.8 / (cols - 1)  # Leave 10% margin on each side
-        y_spacing = config.frame_height * 0.6 / (rows - 1)  # Leave 20% margin on top/bottom
-        
-        # Starting position (top-left)
-        start_x = -config.frame_width * 0.4  # Start 40% from left edge
-        start_y = config.frame_height * 0.3   # Start 30% from top
-        
-        # Create positions in a snake pattern
-        current_word = 0
-        for row in range(rows):
-            for col in range(cols):
-                if current_word >= len(words):
-                    break
-                    
-                # Calculate x position (alternate direction for each row)
-                if row % 2 == 0:
-                    x = start_x + (col * x_spacing)
-                else:
-                    x = start_x + ((cols - 1 - col) * x_spacing)
-                    
-                y = start_y - (row * y_spacing)
-                
-                positions.append(np.array([x, y, 0]))
-                current_word += 1
-                if current_word >= len(words):
-                    break
-
-        # Create text objects and nodes
-        text_objects = []
-        nodes = []
-        for i, word in enumerate(words):
-            text_obj = Text(word, font_size=24)
-            node = Circle(radius=0.3, color=WHITE)
-            
-            # Position both text and node
-            node.move_to(positions[i])
-            text_obj.move_to(positions[i])
-            
-            text_objects.append(text_obj)
-            nodes.append(node)
-
-        # Create arrows between nodes
-        arrows = []
-        for i in range(len(nodes) - 1):
-            start_node = nodes[i]
-            end_node = nodes[i + 1]
-            
-            # Calculate arrow direction vector
-            direction = end_node.get_center() - start_node.get_center()
-            unit_vector = direction / np.linalg.norm(direction)
-            
-            # Create arrow with proper positioning
-            arrow = Arrow(
-                start_node.get_center() + unit_vector * 0.3,
-                end_node.get_center() - unit_vector * 0.3,
-                buff=0,
-                max_tip_length_to_length_ratio=0.15,
-                stroke_width=2  # Thinner arrows
+        words = self.text.split()
+        n = len(words)
+        positions, spacing = snake_layout(n)
+        radius = min(0.3, 0.4 * spacing)
+        font_size = 24 * radius / 0.3
+        first_index, token_node, node_positions, counts, edges = build_word_graph(
+            words, positions
+        )
+
+        # Repeated words get a colour each, in order of first appearance
+        repeated_nodes = np.flatnonzero(counts > 1)
+        repeated_nodes = repeated_nodes[np.argsort(first_index[repeated_nodes])]
+        node_color = {
+            node: MERGE_COLORS[i % len(MERGE_COLORS)]
+            for i, node in enumerate(repeated_nodes)
+        }
+        is_repeated = counts[token_node] > 1
+
+        use_arrows = n <= self.max_detailed_words
+        in_frame = (np.abs(positions[:, 0]) + radius <= config.frame_width / 2) & (
+            np.abs(positions[:, 1]) + radius <= config.frame_height / 2
+        )
+        detailed = in_frame & use_arrows & (radius >= self.min_detail_radius)
+
+        # Create text objects and nodes for the detailed words
+        nodes, text_objects = {}, {}
+        for i in np.flatnonzero(detailed):
+            nodes[i] = Circle(radius=radius, color=WHITE).move_to(positions[i])
+            text_objects[i] = Text(words[i], font_size=font_size).move_to(positions[i])
+
+        # Everything else is a single batched point cloud
+        cloud_ids = np.flatnonzero(~detailed)
+        cloud = PMobject(stroke_width=max(2, int(radius * 40)))
+        if len(cloud_ids):
+            cloud.add_points(positions[cloud_ids], color=WHITE)
+
+        # Create arrows between consecutive words
+        if use_arrows:
+            arrows = [
+                node_arrow(positions[i], positions[i + 1], radius, radius)
+                for i in range(n - 1)
+            ]
+            chain = VGroup(*arrows)
+        else:
+            chain = EdgeBundle(
+                positions[:-1], positions[1:], angle=0, opacity=0.5, stroke_width=1
             )
-            arrows.append(arrow)
 
         # Initial animation
         self.play(
-            *[Create(node) for node in nodes],
-            *[Write(text_obj) for text_obj in text_objects],
-            run_time=1
+            *[Create(node) for node in nodes.values()],
+            *[Write(text_obj) for text_obj in text_objects.values()],
+            *([FadeIn(cloud)] if len(cloud_ids) else []),
+            run_time=1,
         )
-        self.play(*[Create(arrow) for arrow in arrows], run_time=1)
+        self.play(Create(chain), run_time=1)
         self.wait()
 
-        # Identify and color 'was' nodes
-        was_indices = [i for i, word in enumerate(words) if word.lower() == "was"]
-        was_nodes = [nodes[i] for i in was_indices]
-        was_texts = [text_objects[i] for i in was_indices]
-
-        self.play(
-            *[node.animate.set_color(RED) for node in was_nodes],
-            *[text.animate.set_color(RED) for text in was_texts],
-            run_time=1
-        )
+        # Identify and color the repeated words
+        highlight = []
+        for i in np.flatnonzero(detailed & is_repeated):
+            color = node_color[token_node[i]]
+            highlight.append(nodes[i].animate.set_color(color))
+            highlight.append(text_objects[i].animate.set_color(color))
+        if len(cloud_ids):
+            node_rgbas = np.tile(color_to_rgba(WHITE), (len(counts), 1))
+            for node, color in node_color.items():
+                node_rgbas[node] = color_to_rgba(color)
+            colored_cloud = cloud.copy()
+            colored_cloud.rgbas[:] = node_rgbas[token_node[cloud_ids]]
+            highlight.append(Transform(cloud, colored_cloud))
+        if not highlight:
+            self.wait(2)
+            return
+        self.play(*highlight, run_time=1)
         self.wait()
 
-        # Calculate merged node position (center of mass of was nodes)
-        center_pos = np.mean([node.get_center() for node in was_nodes], axis=0)
-        merged_node = Circle(radius=0.5, color=RED)
-        merged_text = Text("was", font_size=24, color=RED)
-        merged_node.move_to(center_pos)
-        merged_text.move_to(center_pos)
+        # Merged nodes sit at the centre of mass of their occurrences
+        merged_radius = radius * 5 / 3
+        merged = {}
+        for node in repeated_nodes:
+            occurrences = np.flatnonzero(detailed & (token_node == node))
+            if len(occurrences) == 0:
+                continue
+            center_pos = node_positions[node]
+            merged_node = Circle(radius=merged_radius, color=node_color[node])
+            merged_text = Text(
+                words[first_index[node]], font_size=font_size, color=node_color[node]
+            )
+            merged[node] = (
+                occurrences,
+                merged_node.move_to(center_pos),
+                merged_text.move_to(center_pos),
+            )
 
         # Prepare arrow animations
-        new_arrows = []
-        arrows_to_remove = []
-
-        # For each was node, update connected arrows
-        for idx in was_indices:
-            if idx > 0:
-                arrows_to_remove.append(arrows[idx - 1])
-                prev_node = nodes[idx - 1]
-                new_arrow = Arrow(
-                    prev_node.get_center(),
-                    merged_node.get_center(),
-                    buff=0.3,
-                    max_tip_length_to_length_ratio=0.15,
-                    stroke_width=2
-                )
-                new_arrows.append(new_arrow)
-
-            if idx < len(words) - 1:
-                arrows_to_remove.append(arrows[idx])
-                next_node = nodes[idx + 1]
-                new_arrow = Arrow(
-                    merged_node.get_center(),
-                    next_node.get_center(),
-                    buff=0.3,
-                    max_tip_length_to_length_ratio=0.15,
-                    stroke_width=2
-                )
-                new_arrows.append(new_arrow)
+        if use_arrows:
+            arrows_to_remove = [
+                arrow
+                for i, arrow in enumerate(arrows)
+                if is_repeated[i] or is_repeated[i + 1]
+            ]
+            node_radius = np.where(counts > 1, merged_radius, radius)
+            new_arrows = VGroup(
+                *[
+                    node_arrow(
+                        node_positions[a],
+                        node_positions[b],
+                        node_radius[a],
+                        node_radius[b],
+                    )
+                    for a, b in edges
+                    if (counts[a] > 1 or counts[b] > 1)
+                    and not np.allclose(node_positions[a], node_positions[b])
+                ]
+            )
+        else:
+            arrows_to_remove = [chain]
+            new_arrows = EdgeBundle(
+                node_positions[edges[:, 0]],
+                node_positions[edges[:, 1]],
+                angle=0,
+                opacity=0.5,
+                stroke_width=1,
+            )
 
         # Animate merging
+        moves = []
+        for occurrences, _, _ in merged.values():
+            for i in occurrences:
+                center_pos = node_positions[token_node[i]]
+                moves.append(nodes[i].animate.move_to(center_pos))
+                moves.append(text_objects[i].animate.move_to(center_pos))
+        if len(cloud_ids):
+            merged_cloud = cloud.copy()
+            merged_cloud.points[:] = node_positions[token_node[cloud_ids]]
+            moves.append(Transform(cloud, merged_cloud))
         self.play(
-            *[node.animate.move_to(center_pos) for node in was_nodes],
-            *[text.animate.move_to(center_pos) for text in was_texts],
+            *moves,
             *[FadeOut(arrow) for arrow in arrows_to_remove],
-            run_time=1
+            run_time=1,
         )
 
         self.play(
-            ReplacementTransform(VGroup(*was_nodes), merged_node),
-            ReplacementTransform(VGroup(*was_texts), merged_text),
-            *[Create(arrow) for arrow in new_arrows],
-            run_time=1
+            *[
+                ReplacementTransform(
+                    VGroup(*[nodes[i] for i in occurrences]), merged_node
+                )
+                for occurrences, merged_node, _ in merged.values()
+            ],
+            *[
+                ReplacementTransform(
+                    VGroup(*[text_objects[i] for i in occurrences]), merged_text
+                )
+                for occurrences, _, merged_text in merged.values()
+            ],
+            Create(new_arrows),
+            run_time=1,
         )
 
         self.wait(2)
 
+
 if __name__ == "__main__":
     scene = TextAnimation()
     scene.render()
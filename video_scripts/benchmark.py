@@ -0,0 +1,222 @@
+"""Render benchmark with per-phase timings for every scene.
+
+Each scene is rendered in a fresh process at a fixed quality preset with
+manim's partial-movie cache disabled. For every scene we record the time spent
+in scene Python (construct), rasterization, encoding and combining the
+partial movies, plus per-play timings, frames/sec and peak RSS.
+
+Usage:
+
+    python benchmark.py -q l --output bench.json --save-baseline
+    python benchmark.py -q l --output bench.json   # compares with the baseline
+"""
+
+import argparse
+import json
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from render_all import QUALITY_FLAGS, SCRIPTS_DIR, discover_scenes, render_scene
+
+DEFAULT_BASELINE = SCRIPTS_DIR / "bench_baseline.json"
+
+# Metrics compared against the baseline; fps is the only higher-is-better one
+TIME_METRICS = ["total", "construct", "rasterize", "encode", "combine"]
+
+
+class PhaseTimings:
+    def __init__(self):
+        self.phases = dict.fromkeys(["rasterize", "encode", "combine"], 0.0)
+        self.frames = 0
+        self.plays = []
+
+    def timed(self, phase, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.phases[phase] += time.perf_counter() - start
+
+    def report(self, total):
+        play_time = sum(play["seconds"] for play in self.plays)
+        return {
+            "total": round(total, 3),
+            "construct": round(total - play_time - self.phases["combine"], 3),
+            **{phase: round(seconds, 3) for phase, seconds in self.phases.items()},
+            "frames": self.frames,
+            "fps": round(self.frames / total, 2) if total else 0.0,
+            "plays": self.plays,
+        }
+
+
+class BenchmarkRenderer(CairoRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = PhaseTimings()
+
+    def play(self, scene, *args, **kwargs):
+        start = time.perf_counter()
+        rasterize = self.timings.phases["rasterize"]
+        encode = self.timings.phases["encode"]
+        start_time = self.time
+        super().play(scene, *args, **kwargs)
+        # Every render mode advances renderer.time by one frame per frame written
+        frames = round((self.time - start_time) * self.camera.frame_rate)
+        self.timings.frames += frames
+        self.timings.plays.append(
+            {
+                "index": len(self.timings.plays),
+                "animations": [type(a).__name__ for a in scene.animations or []],
+                "seconds": round(time.perf_counter() - start, 4),
+                "rasterize": round(self.timings.phases["rasterize"] - rasterize, 4),
+                "encode": round(self.timings.phases["encode"] - encode, 4),
+                "frames": frames,
+            }
+        )
+
+    def update_frame(self, *args, **kwargs):
+        return self.timings.timed("rasterize", super().update_frame, *args, **kwargs)
+
+    def get_frame(self):
+        return self.timings.timed("rasterize", super().get_frame)
+
+
+class BenchmarkFileWriter(SceneFileWriter):
+    def _timed(self, phase, func, *args, **kwargs):
+        timings = getattr(self.renderer, "timings", None)
+        if timings is None:
+            return func(*args, **kwargs)
+        return timings.timed(phase, func, *args, **kwargs)
+
+    def write_frame(self, frame_or_renderer):
+        return self._timed("encode", super().write_frame, frame_or_renderer)
+
+    def write_still(self, frame, num_frames):
+        # Only reached when combined with the freeze-frame writer
+        return self._timed("encode", super().write_still, frame, num_frames)
+
+    def open_movie_pipe(self, *args, **kwargs):
+        return self._timed("encode", super().open_movie_pipe, *args, **kwargs)
+
+    def close_movie_pipe(self):
+        return self._timed("encode", super().close_movie_pipe)
+
+    def combine_to_movie(self):
+        return self._timed("combine", super().combine_to_movie)
+
+
+def benchmark_scene(script, scene_name, quality, media_dir, options):
+    result = render_scene(script, scene_name, quality, media_dir, options)
+    # ru_maxrss is in KiB on Linux; children covers the ffmpeg encoders
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    result["peak_rss_mb"] = round(own / 1024, 1)
+    result["peak_ffmpeg_rss_mb"] = round(children / 1024, 1)
+    return result
+
+
+def run_benchmark(scenes, quality, media_dir, options=None):
+    options = {**(options or {}), "benchmark": True}
+    results = {}
+    for script, name in scenes:
+        # A fresh process per scene keeps peak RSS and warm caches per scene
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(
+                benchmark_scene, script, name, quality, media_dir, options
+            ).result()
+        if "error" in result:
+            print(f"[FAILED] {name}\n{result['error']}")
+            continue
+        phases = result["phases"]
+        print(
+            f"[done] {name}: {phases['total']:.2f}s total, "
+            f"{phases['construct']:.2f}s construct, "
+            f"{phases['rasterize']:.2f}s rasterize, "
+            f"{phases['encode']:.2f}s encode, {phases['combine']:.2f}s combine, "
+            f"{phases['fps']:.1f} fps, {result['peak_rss_mb']:.0f} MB"
+        )
+        results[name] = {
+            "script": result["script"],
+            **phases,
+            "peak_rss_mb": result["peak_rss_mb"],
+            "peak_ffmpeg_rss_mb": result["peak_ffmpeg_rss_mb"],
+        }
+    return results
+
+
+def compare(results, baseline, threshold, min_seconds=0.05):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in TIME_METRICS + ["peak_rss_mb"]:
+            old, new = previous.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            # Ignore tiny absolute changes, which are mostly timer noise
+            if new > old * (1 + threshold) and new - old > min_seconds:
+                regressions.append((name, metric, old, new))
+        if current["fps"] < previous.get("fps", 0) * (1 - threshold):
+            regressions.append((name, "fps", previous["fps"], current["fps"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    parser.add_argument("--scene", action="append", help="only these scenes")
+    parser.add_argument("--media-dir", default=str(SCRIPTS_DIR / "media" / "bench"))
+    parser.add_argument("--output", help="write the JSON results to this path")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed slowdown (0.1 = 10%%)"
+    )
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes()
+    if args.scene:
+        scenes = [(path, name) for path, name in scenes if name in args.scene]
+    if not scenes:
+        parser.error("no scenes to benchmark")
+
+    quality = QUALITY_FLAGS[args.quality]
+    results = run_benchmark(scenes, quality, args.media_dir)
+    report = {"quality": quality, "scenes": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline = {}
+        if baseline_path.exists():
+            baseline = json.loads(baseline_path.read_text())
+        baseline.setdefault(quality, {}).update(results)
+        baseline_path.write_text(json.dumps(baseline, indent=2))
+        print(f"\nBaseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path}; run with --save-baseline first")
+        return 0
+    baseline = json.loads(baseline_path.read_text()).get(quality, {})
+    regressions = compare(results, baseline, args.threshold)
+    print()
+    for name, metric, old, new in regressions:
+        print(f"REGRESSION {name} {metric}: {old} -> {new}")
+    if not regressions:
+        print("No regressions against the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
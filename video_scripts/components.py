@@ -0,0 +1,130 @@
+"""Prototype-and-copy factory for the small mobjects the scenes repeat.
+
+Each component is built once per shape (label text, size) as a colourless
+template and every call returns a deep copy with its colour applied. Copying
+skips text parsing, ``SurroundingRectangle`` fitting and Bezier point
+generation, which dominate construction time when a scene builds dozens of
+token boxes, hidden states or attention heads.
+
+Run ``python components.py -n 200`` to compare against rebuilding each
+component from scratch.
+"""
+
+import argparse
+import time
+
+from manim import *
+
+_templates = {}
+
+
+def from_template(key, build):
+    # Build once per key, then hand out copies
+    template = _templates.get(key)
+    if template is None:
+        template = _templates[key] = build()
+    return template.copy()
+
+
+def clear_templates():
+    _templates.clear()
+
+
+def text(label, font_size):
+    return from_template(
+        ("text", label, font_size), lambda: Text(label, font_size=font_size)
+    )
+
+
+def math_tex(label):
+    return from_template(("math_tex", label), lambda: MathTex(label))
+
+
+def token_box(label, color=WHITE, font_size=24):
+    def build():
+        token = text(label, font_size)
+        box = SurroundingRectangle(token, corner_radius=0.1)
+        return VGroup(token, box)
+
+    group = from_template(("token_box", label, font_size), build)
+    group[1].set_color(color)
+    return group
+
+
+def hidden_state(label="h", color=BLUE, radius=0.3):
+    circle = from_template(("hidden_state", radius), lambda: Circle(radius=radius))
+    tex = math_tex(label).move_to(circle.get_center())
+    return VGroup(circle, tex).set_color(color)
+
+
+def attention_head(color, label, source, position=ORIGIN, scale=1):
+    def build():
+        # Q, K, V boxes, centred on the origin
+        qkv = VGroup(
+            *[Rectangle(height=0.4, width=0.3, fill_opacity=0.3) for _ in range(3)]
+        ).arrange(RIGHT, buff=0.2)
+        labels = VGroup(
+            *[
+                text(t, 14).next_to(box, UP, buff=0.1)
+                for t, box in zip(["Q", "K", "V"], qkv)
+            ]
+        )
+        # Attention box
+        att_box = Rectangle(height=0.6, width=0.6, fill_opacity=0.2)
+        att_box.next_to(qkv, RIGHT, buff=1)
+        att_arrow = Arrow(qkv[0].get_right(), att_box.get_left(), stroke_width=2)
+        return VGroup(qkv, labels, att_box, att_arrow)
+
+    head = from_template(("attention_head",), build)
+    head.scale(scale, about_point=ORIGIN).shift(position)
+    qkv, labels, att_box, att_arrow = head
+    att_label = text(label, 16).scale(scale)
+    att_label.next_to(att_box, UP, buff=DEFAULT_MOBJECT_TO_MOBJECT_BUFFER * scale)
+    # The input arrows depend on where the input sits, so they are per head
+    input_arrows = VGroup(
+        *[Arrow(source, box.get_left(), stroke_width=2) for box in qkv]
+    )
+    head_group = VGroup(qkv, labels, att_box, att_label, input_arrows, att_arrow)
+    return head_group.set_color(color), att_box
+
+
+def benchmark(count):
+    colors = [RED, GREEN, BLUE, YELLOW, PURPLE, TEAL]
+    cases = {
+        "token_box": lambda i, color: token_box(f"w{i % 20}", color),
+        "hidden_state": lambda i, color: hidden_state(f"h_{{{i % 20}}}", color),
+        "attention_head": lambda i, color: attention_head(
+            color, f"Head {i % 16 + 1}", LEFT * 6, LEFT * 2
+        ),
+    }
+    results = {}
+    for name, make in cases.items():
+        # From scratch: every call rebuilds its templates
+        start = time.perf_counter()
+        for i in range(count):
+            clear_templates()
+            make(i, colors[i % len(colors)])
+        scratch = time.perf_counter() - start
+
+        clear_templates()
+        start = time.perf_counter()
+        for i in range(count):
+            make(i, colors[i % len(colors)])
+        copied = time.perf_counter() - start
+        results[name] = (scratch, copied)
+        print(
+            f"{name:<16} {count} built: {scratch:7.3f}s from scratch, "
+            f"{copied:7.3f}s from templates ({scratch / copied:5.1f}x)"
+        )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the component factory")
+    parser.add_argument("-n", "--count", type=int, default=200)
+    args = parser.parse_args(argv)
+    benchmark(args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Dry run: execute a scene's construct without drawing or encoding anything.
+
+Animations are still stepped frame by frame, so updaters and rate functions
+run as in a real render, but no frame is rasterized and no movie is written.
+For each scene the run reports
+
+* the total duration and the number of ``play()`` and ``wait()`` calls,
+* the peak number of mobjects on screen, and
+* layout problems at the end of every play: visible mobjects that are
+  outside or partly outside the frame, and texts whose bounding boxes
+  overlap.
+
+Usage:
+
+    python render_all.py --dry-run
+    python render_all.py --dry-run --scene RNNLimitationsAnimation --report ci.json
+"""
+
+import numpy as np
+from manim import MarkupText, SingleStringMathTex, Text, Wait
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+from no_draw import NoDrawRenderer
+from play_profiler import scene_stack
+from prune import is_transparent
+
+TEXT_TYPES = (Text, MarkupText, SingleStringMathTex)
+
+# Scene units a box may stick out of the frame, or into another text box,
+# before it is reported
+TOLERANCE = 0.05
+
+
+def describe(mob):
+    label = getattr(mob, "text", None) or getattr(mob, "tex_string", None)
+    name = type(mob).__name__
+    if label:
+        label = " ".join(str(label).split())
+        return f"{name}({label[:40]!r})"
+    x, y = mob.get_center()[:2]
+    return f"{name} at ({x:.1f}, {y:.1f})"
+
+
+def visible_bounds(mob):
+    """(low, high) corners of the visible parts of ``mob``, or None."""
+    points = [
+        sub.points
+        for sub in mob.get_family()
+        if len(sub.points) and not is_transparent(sub)
+    ]
+    if not points:
+        return None
+    points = np.concatenate(points)[:, :2]
+    return points.min(axis=0), points.max(axis=0)
+
+
+def text_mobjects(mobjects):
+    # Texts are not searched for nested texts; their glyphs are submobjects
+    found, todo = [], list(mobjects)
+    while todo:
+        mob = todo.pop(0)
+        if isinstance(mob, TEXT_TYPES):
+            found.append(mob)
+        else:
+            todo.extend(mob.submobjects)
+    return found
+
+
+class DryRunRenderer(NoDrawRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.plays = 0
+        self.waits = 0
+        self.peak_mobjects = 0
+        self.issues = {}
+
+    def play(self, scene, *args, **kwargs):
+        stack = scene_stack(scene)
+        super().play(scene, *args, **kwargs)
+        animations = scene.animations or []
+        if len(animations) == 1 and isinstance(animations[0], Wait):
+            self.waits += 1
+        else:
+            self.plays += 1
+        self.count_mobjects(scene)
+        self.check_layout(scene, f"{stack[-1][0]}:{stack[-1][2]}" if stack else "")
+
+    def count_mobjects(self, scene):
+        mobjects = extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            only_those_with_points=True,
+        )
+        self.peak_mobjects = max(self.peak_mobjects, len(mobjects))
+
+    def report(self, key, kind, message, source):
+        # Each problem is reported once, where it first shows up
+        if key not in self.issues:
+            self.issues[key] = {
+                "kind": kind,
+                "message": message,
+                "play": self.num_plays - 1,
+                "source": source,
+            }
+
+    def check_layout(self, scene, source):
+        camera = self.camera
+        half = np.array([camera.frame_width, camera.frame_height]) / 2
+        center = np.asarray(camera.frame_center)[:2]
+        frame_low, frame_high = center - half, center + half
+
+        for mob in list_update(scene.mobjects, scene.foreground_mobjects):
+            bounds = visible_bounds(mob)
+            if bounds is None:
+                continue
+            low, high = bounds
+            if np.any(high < frame_low) or np.any(low > frame_high):
+                kind = "outside"
+            elif np.any(low < frame_low - TOLERANCE) or np.any(
+                high > frame_high + TOLERANCE
+            ):
+                kind = "partly outside"
+            else:
+                continue
+            self.report(
+                (kind, id(mob)), kind, f"{describe(mob)} is {kind} the frame", source
+            )
+
+        texts = []
+        for mob in text_mobjects(scene.mobjects):
+            bounds = visible_bounds(mob)
+            if bounds is not None:
+                texts.append((mob, bounds))
+        for i, (a, (low_a, high_a)) in enumerate(texts):
+            for b, (low_b, high_b) in texts[i + 1 :]:
+                overlap = np.minimum(high_a, high_b) - np.maximum(low_a, low_b)
+                if np.all(overlap > TOLERANCE):
+                    self.report(
+                        ("overlap", id(a), id(b)),
+                        "overlap",
+                        f"{describe(a)} overlaps {describe(b)}",
+                        source,
+                    )
+
+    def render(self, scene, time, moving_mobjects):
+        self.count_mobjects(scene)
+        super().render(scene, time, moving_mobjects)
+
+    def dry_run_stats(self):
+        return {
+            "duration": round(self.time, 2),
+            "plays": self.plays,
+            "waits": self.waits,
+            "peak_mobjects": self.peak_mobjects,
+            "issues": list(self.issues.values()),
+        }
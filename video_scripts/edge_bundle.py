@@ -0,0 +1,153 @@
+from manim import *
+import numpy as np
+
+
+def arc_bezier_points(starts, ends, angle=0.1, segments_per_edge=1):
+    """Cubic Bezier control points for many ArcBetweenPoints-style arcs at once.
+
+    Returns an array of shape (num_edges, segments_per_edge * 4, 3), laid out
+    the way a VMobject stores its points.
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    n = segments_per_edge
+
+    if abs(angle) < 1e-6:
+        # Straight lines: handles at a third and two thirds of the way
+        t = np.linspace(0, 1, 3 * n + 1)
+        pts = starts[:, None] + t[None, :, None] * (ends - starts)[:, None]
+        idx = np.arange(n)[:, None] * 3 + np.arange(4)[None, :]
+        return pts[:, idx].reshape(len(starts), 4 * n, 3)
+
+    chord = ends - starts
+    length = np.linalg.norm(chord[:, :2], axis=1)
+    length[length == 0] = 1e-8
+
+    # Like ArcBetweenPoints, a positive angle runs counterclockwise, so the
+    # centre sits to the left of start -> end
+    normal = np.stack([-chord[:, 1], chord[:, 0]], axis=1) / length[:, None]
+    center = (starts[:, :2] + ends[:, :2]) / 2 + normal * (
+        length / 2 / np.tan(angle / 2)
+    )[:, None]
+    radius = length / (2 * np.abs(np.sin(angle / 2)))
+    offset = starts[:, :2] - center
+    start_angle = np.arctan2(offset[:, 1], offset[:, 0])
+
+    delta = angle / n
+    theta = start_angle[:, None] + delta * np.arange(n + 1)[None, :]
+    anchors = center[:, None] + radius[:, None, None] * np.stack(
+        [np.cos(theta), np.sin(theta)], axis=-1
+    )
+    tangents = np.stack([-np.sin(theta), np.cos(theta)], axis=-1)
+    handle = (4 / 3 * np.tan(delta / 4) * radius)[:, None, None]
+
+    pts = np.empty((len(starts), n, 4, 3))
+    pts[:, :, 0, :2] = anchors[:, :-1]
+    pts[:, :, 1, :2] = anchors[:, :-1] + handle * tangents[:, :-1]
+    pts[:, :, 2, :2] = anchors[:, 1:] - handle * tangents[:, 1:]
+    pts[:, :, 3, :2] = anchors[:, 1:]
+    # Arcs live in the xy plane; interpolate z along each edge
+    z = np.linspace(0, 1, 3 * n + 1)
+    z = starts[:, 2:3] + z[None, :] * chord[:, 2:3]
+    pts[..., 2] = z[:, np.arange(n)[:, None] * 3 + np.arange(4)[None, :]]
+    return pts.reshape(len(starts), 4 * n, 3)
+
+
+class EdgeBundle(VGroup):
+    """Many edges drawn as a handful of VMobjects instead of one per edge.
+
+    All edge geometry is computed in one NumPy pass. Edges that share a
+    colour and (quantised) opacity are packed into a single VMobject as
+    separate subpaths, so the whole bundle costs a few Cairo strokes per frame
+    and animates as one object.
+    """
+
+    def __init__(
+        self,
+        starts,
+        ends,
+        angle=0.1,
+        segments_per_edge=1,
+        color=WHITE,
+        opacity=1.0,
+        stroke_width=DEFAULT_STROKE_WIDTH,
+        opacity_levels=16,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.segments_per_edge = segments_per_edge
+        self.opacity_levels = max(2, opacity_levels)
+        self.edge_stroke_width = stroke_width
+        points = arc_bezier_points(starts, ends, angle, segments_per_edge)
+        self.num_edges = len(points)
+        self._build(points, color, opacity)
+
+    @classmethod
+    def between_layers(cls, layers, **kwargs):
+        # Fully connect each layer of nodes to the next one
+        starts, ends = [], []
+        for curr_layer, next_layer in zip(layers, layers[1:]):
+            curr = np.array([node.get_center() for node in curr_layer])
+            nxt = np.array([node.get_center() for node in next_layer])
+            starts.append(np.repeat(curr, len(nxt), axis=0))
+            ends.append(np.tile(nxt, (len(curr), 1)))
+        return cls(np.concatenate(starts), np.concatenate(ends), **kwargs)
+
+    def _per_edge(self, values, convert):
+        if isinstance(values, (str, ManimColor)) or np.ndim(values) == 0:
+            return np.full(self.num_edges, convert(values), dtype=object)
+        if len(values) != self.num_edges:
+            raise ValueError(f"Expected {self.num_edges} values, got {len(values)}")
+        return np.array([convert(v) for v in values], dtype=object)
+
+    def _build(self, points, colors, opacities):
+        levels_count = self.opacity_levels
+        self.edge_colors = self._per_edge(colors, lambda c: ManimColor(c).to_hex())
+        self.edge_opacities = np.clip(
+            np.broadcast_to(np.asarray(opacities, dtype=float), (self.num_edges,)),
+            0,
+            1,
+        )
+        levels = np.rint(self.edge_opacities * (levels_count - 1)).astype(int)
+        color_names, color_ids = np.unique(
+            self.edge_colors.astype(str), return_inverse=True
+        )
+        codes, bucket_of_edge = np.unique(
+            color_ids * levels_count + levels, return_inverse=True
+        )
+
+        buckets = []
+        for i, code in enumerate(codes):
+            edge_ids = np.flatnonzero(bucket_of_edge == i)
+            bucket = VMobject()
+            bucket.set_points(points[edge_ids].reshape(-1, 3))
+            bucket.set_fill(opacity=0)
+            bucket.set_stroke(
+                color=color_names[code // levels_count],
+                width=self.edge_stroke_width,
+                opacity=(code % levels_count) / (levels_count - 1),
+            )
+            bucket.edge_ids = edge_ids
+            buckets.append(bucket)
+        self.remove(*self.submobjects)
+        self.add(*buckets)
+        return self
+
+    def get_edge_points(self):
+        points = np.empty((self.num_edges, 4 * self.segments_per_edge, 3))
+        for bucket in self.submobjects:
+            points[bucket.edge_ids] = bucket.points.reshape(len(bucket.edge_ids), -1, 3)
+        return points
+
+    def get_edge_center(self, index):
+        # Bounding-box centre, like get_center() of the matching arc
+        points = self.get_edge_points()[index]
+        return (points.min(axis=0) + points.max(axis=0)) / 2
+
+    def set_edge_style(self, colors=None, opacities=None):
+        # Regroup edges after per-edge colour/opacity changes
+        return self._build(
+            self.get_edge_points(),
+            self.edge_colors if colors is None else colors,
+            self.edge_opacities if opacities is None else opacities,
+        )
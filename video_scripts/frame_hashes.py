@@ -0,0 +1,131 @@
+"""Deterministic rendering and per-play frame hashes.
+
+With ``render_all.py --deterministic`` each scene runs with ``random`` and
+NumPy seeded from its name, so scenes like ``EnhancedWordEmbeddingAnimation``
+draw the same values on every run and machine, and manim's partial-movie
+cache can hit. ``FrameHashRenderer`` records a perceptual hash (dHash) of the
+end state of every ``play()``:
+
+* Cached segments are validated. The hash of each rendered segment is stored
+  next to manim's partial movies. When a later run reuses a segment whose
+  end state no longer matches (different fonts, LaTeX, manim build), the
+  segment is deleted so the next render rebuilds it, and render_all.py
+  fails the scene, whose movie already contains it.
+* The hashes double as a golden-frame regression check:
+  ``--save-golden golden_frames.json`` stores them and ``--golden
+  golden_frames.json`` compares a run against them.
+"""
+
+import json
+import random
+import zlib
+from pathlib import Path
+
+import numpy as np
+from manim import logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from PIL import Image
+
+# dHash bits that may differ before two frames count as different
+MAX_DISTANCE = 4
+
+
+def seed_for(scene_name, base_seed=0):
+    # crc32 is stable across processes and machines, unlike hash()
+    return (zlib.crc32(scene_name.encode()) + base_seed) % 2**32
+
+
+def seed_everything(scene_name, base_seed=0):
+    seed = seed_for(scene_name, base_seed)
+    random.seed(seed)
+    np.random.seed(seed)
+    return seed
+
+
+def dhash(frame, size=8):
+    """64-bit difference hash of an RGB(A) frame, as 16 hex digits."""
+    image = Image.fromarray(np.asarray(frame)[:, :, :3]).convert("L")
+    pixels = np.asarray(image.resize((size + 1, size), Image.BILINEAR), dtype=int)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return f"{int(''.join('1' if b else '0' for b in bits), 2):0{size * size // 4}x}"
+
+
+def hamming(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+class FrameHashRenderer(CairoRenderer):
+    manifest_name = "frame_hashes.json"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frame_hashes = []
+        self.invalid_segments = []
+        self._manifest = None
+
+    def manifest_path(self):
+        directory = getattr(self.file_writer, "partial_movie_directory", None)
+        return Path(directory) / self.manifest_name if directory else None
+
+    def manifest(self):
+        if self._manifest is None:
+            path = self.manifest_path()
+            self._manifest = {}
+            if path is not None and path.exists():
+                self._manifest = json.loads(path.read_text())
+        return self._manifest
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        animation_hash = self.animations_hashes[-1]
+        cached = self.skip_animations and animation_hash is not None
+
+        # Cached plays draw nothing, so draw the end state for every play
+        self.update_frame(scene)
+        frame_hash = dhash(self.camera.pixel_array)
+        self.frame_hashes.append(frame_hash)
+        if animation_hash is None:
+            return
+        if animation_hash.startswith("uncached_"):
+            # manim's placeholder when caching is off says nothing about the
+            # content; key the entry by its play index instead
+            animation_hash = f"play{self.num_plays - 1:05}"
+
+        known = self.manifest().get(animation_hash)
+        if cached and known is not None and hamming(known, frame_hash) > MAX_DISTANCE:
+            logger.warning(
+                "Cached segment %d of %s does not match its recorded end frame",
+                self.num_plays - 1,
+                type(scene).__name__,
+            )
+            self.invalid_segments.append(self.file_writer.partial_movie_files[-1])
+            self.manifest().pop(animation_hash)
+        elif not cached:
+            self.manifest()[animation_hash] = frame_hash
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        # The stale segments were used for this movie; drop them so the next
+        # render encodes them again
+        for path in self.invalid_segments:
+            if path:
+                Path(path).unlink(missing_ok=True)
+        path = self.manifest_path()
+        if path is not None and self._manifest is not None:
+            path.write_text(json.dumps(self._manifest, indent=2))
+
+
+def compare_golden(results, golden, max_distance=MAX_DISTANCE):
+    """(scene, play index, expected, actual) for every frame that changed."""
+    mismatches = []
+    for result in results:
+        expected = golden.get(result["scene"])
+        actual = result.get("frame_hashes")
+        if expected is None or actual is None:
+            continue
+        for index in range(max(len(expected), len(actual))):
+            old = expected[index] if index < len(expected) else None
+            new = actual[index] if index < len(actual) else None
+            if old is None or new is None or hamming(old, new) > max_distance:
+                mismatches.append((result["scene"], index, old, new))
+    return mismatches
@@ -0,0 +1,200 @@
+"""Stream frames straight to the encoder instead of partial movie files.
+
+``StreamingFileWriter`` keeps one ffmpeg process open for the whole scene and
+writes the final movie directly, so no partial movie files are written and
+nothing has to be concatenated at the end. A writer thread feeds ffmpeg from a
+bounded queue, so the rasterizer can run a few frames ahead of the encoder
+without buffering the whole scene in memory.
+
+``iter_scene_frames`` renders a scene in a background thread and yields its
+frames as NumPy arrays, which is handy for tests and for frame analysis
+without touching the disk.
+"""
+
+import subprocess
+from queue import Full, Queue
+from threading import Thread
+
+from manim import __version__, config, logger, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format, write_to_movie
+
+_END = object()
+
+
+def encoder_command(output_path):
+    """ffmpeg command that encodes raw RGBA frames from stdin for the current config."""
+    fps = config["frame_rate"]
+    if fps == int(fps):
+        fps = int(fps)
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-f",
+        "rawvideo",
+        "-s",
+        f"{config['pixel_width']}x{config['pixel_height']}",
+        "-pix_fmt",
+        "rgba",
+        "-r",
+        str(fps),
+        "-i",
+        "-",
+        "-an",
+        "-loglevel",
+        config["ffmpeg_loglevel"].lower(),
+        "-metadata",
+        f"comment=Rendered with Manim Community v{__version__}",
+    ]
+    if is_webm_format():
+        command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+    elif config["transparent"]:
+        command += ["-vcodec", "qtrle"]
+    else:
+        command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+    return command + [str(output_path)]
+
+
+class StreamingFileWriter(SceneFileWriter):
+    max_buffered_frames = 8
+    # Seconds between checks that the writer thread is still alive while the
+    # queue is full
+    put_timeout = 1.0
+
+    def is_already_cached(self, hash_invocation):
+        # A skipped animation would leave a gap in the single output stream
+        return False
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write and not hasattr(self, "_frames"):
+            self.open_stream()
+
+    def end_animation(self, allow_write=False):
+        # The stream stays open across animations
+        pass
+
+    def open_stream(self):
+        command = encoder_command(self.movie_file_path)
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self._frames = Queue(maxsize=self.max_buffered_frames)
+        self._pump_error = None
+        self._pump = Thread(target=self._pump_frames, daemon=True)
+        self._pump.start()
+
+    def _pump_frames(self):
+        try:
+            while True:
+                data = self._frames.get()
+                if data is _END:
+                    break
+                self.writing_process.stdin.write(data)
+        except Exception as error:
+            # e.g. BrokenPipeError when ffmpeg exits; raised again by the
+            # renderer's next write_frame() or finish()
+            self._pump_error = error
+
+    def _put(self, item):
+        # Blocks once max_buffered_frames are waiting for the encoder, but
+        # not forever if the writer thread has died
+        while True:
+            self._check_pump()
+            try:
+                self._frames.put(item, timeout=self.put_timeout)
+                return
+            except Full:
+                pass
+
+    def _check_pump(self):
+        if self._pump_error is not None:
+            raise RuntimeError(
+                f"Streaming to ffmpeg failed for {self.movie_file_path}"
+            ) from self._pump_error
+        if not self._pump.is_alive():
+            raise RuntimeError(
+                f"Streaming to ffmpeg stopped for {self.movie_file_path}"
+            )
+
+    def write_frame(self, frame_or_renderer):
+        if not hasattr(self, "_frames"):
+            return super().write_frame(frame_or_renderer)
+        self._put(frame_or_renderer.tobytes())
+
+    def finish(self):
+        if not hasattr(self, "_frames"):
+            return super().finish()
+        try:
+            self._put(_END)
+            self._pump.join()
+            if self._pump_error is not None:
+                self._check_pump()
+        finally:
+            try:
+                self.writing_process.stdin.close()
+            except BrokenPipeError:
+                pass
+            self.writing_process.wait()
+        if self.writing_process.returncode:
+            raise RuntimeError(
+                f"ffmpeg exited with code {self.writing_process.returncode} "
+                f"while encoding {self.movie_file_path}"
+            )
+        if self.includes_sound:
+            logger.warning("Sound is not supported when streaming frames; skipped")
+        self.print_file_ready_message(str(self.movie_file_path))
+
+
+class _MemoryFrameWriter(SceneFileWriter):
+    frame_queue = None
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        pass
+
+    def end_animation(self, allow_write=False):
+        pass
+
+    def write_frame(self, frame_or_renderer):
+        self.frame_queue.put(frame_or_renderer.copy())
+
+    def finish(self):
+        pass
+
+
+def iter_scene_frames(scene_cls, overrides=None, max_buffered=8):
+    """Yield the frames of ``scene_cls`` as RGBA arrays while it renders.
+
+    At most ``max_buffered`` frames are held in memory at a time. Stop
+    iterating early only if you don't need the scene to finish; the render
+    thread is a daemon and is dropped with the process.
+    """
+    frames = Queue(maxsize=max_buffered)
+    writer_cls = type(
+        "MemoryFrameWriter", (_MemoryFrameWriter,), {"frame_queue": frames}
+    )
+
+    def run():
+        try:
+            with tempconfig(
+                {
+                    "write_to_movie": False,
+                    "save_last_frame": False,
+                    "disable_caching": True,
+                    "progress_bar": "none",
+                    **(overrides or {}),
+                }
+            ):
+                renderer = CairoRenderer(file_writer_class=writer_cls)
+                scene_cls(renderer=renderer).render()
+        except BaseException as error:
+            frames.put(error)
+        finally:
+            frames.put(_END)
+
+    Thread(target=run, daemon=True).start()
+    while True:
+        item = frames.get()
+        if item is _END:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
@@ -0,0 +1,115 @@
+"""Freeze-frame encoding for static ``self.wait()`` holds.
+
+Manim already rasterizes a static wait only once, but it still pushes the
+same frame through the ffmpeg pipe once per output frame. These classes hand
+the frame to ffmpeg a single time and let it clone the frame for the rest of
+the hold, so x264 stores it as a keyframe followed by near-empty skip frames.
+The partial movie keeps the scene frame rate, so it concatenates with the
+other segments exactly like a normally encoded one.
+"""
+
+import subprocess
+
+from manim import __version__, config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format, write_to_movie
+
+
+class FreezeFrameFileWriter(SceneFileWriter):
+    def begin_animation(self, allow_write=False, file_path=None):
+        # Don't start ffmpeg until we know whether this segment is a hold
+        self._deferred_animation = (allow_write, file_path)
+        self._wrote_still = False
+
+    def _start_deferred_animation(self):
+        if getattr(self, "_deferred_animation", None) is not None:
+            allow_write, file_path = self._deferred_animation
+            self._deferred_animation = None
+            super().begin_animation(allow_write, file_path)
+
+    def write_frame(self, frame_or_renderer):
+        self._start_deferred_animation()
+        super().write_frame(frame_or_renderer)
+
+    def end_animation(self, allow_write=False):
+        if getattr(self, "_wrote_still", False):
+            self._wrote_still = False
+            return
+        self._start_deferred_animation()
+        super().end_animation(allow_write)
+
+    def write_still(self, frame, num_frames):
+        allow_write, file_path = self._deferred_animation
+        if not (write_to_movie() and allow_write) or num_frames <= 1:
+            for _ in range(num_frames):
+                self.write_frame(frame)
+            return
+
+        self._deferred_animation = None
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        fps = config["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+        height, width = frame.shape[:2]
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-f",
+            "rawvideo",
+            "-s",
+            f"{width}x{height}",
+            "-pix_fmt",
+            "rgba",
+            "-r",
+            str(fps),
+            "-i",
+            "-",
+            # Repeat the single input frame until the hold is num_frames long
+            "-vf",
+            f"tpad=stop_mode=clone:stop={num_frames - 1}",
+            "-r",
+            str(fps),
+            "-an",
+            "-loglevel",
+            config["ffmpeg_loglevel"].lower(),
+            "-metadata",
+            f"comment=Rendered with Manim Community v{__version__}",
+        ]
+        # The codec settings of SceneFileWriter.open_movie_pipe: the segments
+        # are joined without re-encoding, so anything that changes the stream
+        # parameters (e.g. -tune) would make the hold decode wrongly
+        if is_webm_format():
+            command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+        elif config["transparent"]:
+            command += ["-vcodec", "qtrle"]
+        else:
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+        command += [file_path]
+
+        process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        process.communicate(frame.tobytes())
+        self._wrote_still = True
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Freeze frame ({num_frames} "
+            "frames) written in %(path)s",
+            {"path": f"'{file_path}'"},
+        )
+
+
+class FreezeFrameRenderer(CairoRenderer):
+    def __init__(self, file_writer_class=FreezeFrameFileWriter, **kwargs):
+        super().__init__(file_writer_class=file_writer_class, **kwargs)
+
+    def freeze_current_frame(self, duration):
+        if not isinstance(self.file_writer, FreezeFrameFileWriter):
+            return super().freeze_current_frame(duration)
+        if self.skip_animations:
+            return
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)
+        self.time += num_frames * dt
+        self.file_writer.write_still(self.get_frame(), num_frames)
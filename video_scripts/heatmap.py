@@ -0,0 +1,70 @@
+from manim import *
+import numpy as np
+
+
+def values_to_rgba(values, colors, vmin=None, vmax=None):
+    """Map an array of values onto a colour ramp, as uint8 RGBA pixels."""
+    values = np.asarray(values, dtype=float)
+    vmin = values.min() if vmin is None else vmin
+    vmax = values.max() if vmax is None else vmax
+    t = np.clip((values - vmin) / ((vmax - vmin) or 1), 0, 1)
+
+    stops = np.linspace(0, 1, len(colors))
+    ramp = np.array([color_to_rgba(color) for color in colors])
+    rgba = np.stack([np.interp(t, stops, ramp[:, c]) for c in range(4)], axis=-1)
+    return (rgba * 255).astype(np.uint8)
+
+
+class Heatmap(ImageMobject):
+    """A vector or matrix of values drawn as one image, one pixel per cell.
+
+    However many cells there are, the camera draws a single resampled image,
+    so render time does not grow with the dimension. 1-D values are shown as
+    a column (one row per dimension), like the cell-per-value vectors.
+    """
+
+    def __init__(
+        self,
+        values,
+        height=4,
+        width=None,
+        colors=(BLUE_E, BLACK, RED_E),
+        vmin=None,
+        vmax=None,
+        **kwargs,
+    ):
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values[:, None]
+        self.values = values
+        self.base_pixels = values_to_rgba(values, colors, vmin, vmax)
+        super().__init__(self.base_pixels.copy(), **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+
+        rows, cols = values.shape
+        if width is None:
+            width = height * cols / rows if cols > 1 else height / 8
+        self.stretch_to_fit_height(height)
+        self.stretch_to_fit_width(width)
+
+    def sweep(self, color=YELLOW, band=None, **kwargs):
+        """One animation that runs a highlight band from the first row to the last.
+
+        Replaces a pair of ``self.play`` calls per row: the band is blended
+        into the pixels each frame, and the image is back to its own colours
+        when the animation ends.
+        """
+        rows = self.values.shape[0]
+        band = band or max(1, rows / 16)
+        highlight = np.array(color_to_rgba(color)) * 255
+        row_centers = np.arange(rows) + 0.5
+
+        def update(mob, alpha):
+            # The band starts above the first row and ends below the last
+            center = alpha * (rows + 2 * band) - band
+            weight = np.clip(1 - np.abs(row_centers - center) / band, 0, 1)
+            weight = weight[:, None, None]
+            pixels = mob.base_pixels * (1 - weight) + highlight * weight
+            mob.pixel_array = pixels.astype(np.uint8)
+
+        return UpdateFromAlphaFunc(self, update, **kwargs)
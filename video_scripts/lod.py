@@ -0,0 +1,147 @@
+"""Level of detail for curved shapes in preview renders.
+
+Every ``Arc`` - and so every ``Circle``, ``Dot``, ``ArcBetweenPoints``,
+``CurvedArrow`` and circular arrow tip - is built from ``num_components``
+anchors, 9 by default, whatever the output resolution. ``install`` lowers that
+default for the preview presets, so a circle is drawn from 4 Bezier curves
+instead of 8 in ``-ql``. Shapes that pass ``num_components`` themselves are
+left alone, and high and production quality keep full detail.
+
+Enable it with ``render_all.py --lod``. To see what it saves, compare the
+point counts of a scene with and without it (construct only, nothing is
+drawn):
+
+    python lod.py --scene LLMTrainingPipeline -q l
+"""
+
+import argparse
+import inspect
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from manim import Arc
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+import components
+from no_draw import NoDrawRenderer, no_output_config
+
+# Anchors per arc for the presets that get reduced detail
+LOD_COMPONENTS = {"low_quality": 5, "medium_quality": 7}
+
+_DEFAULTS = Arc.__init__.__defaults__
+_PARAMS = [
+    name
+    for name, param in inspect.signature(Arc.__init__).parameters.items()
+    if param.default is not param.empty and param.kind is param.POSITIONAL_OR_KEYWORD
+]
+FULL_COMPONENTS = _DEFAULTS[_PARAMS.index("num_components")]
+
+
+def install(quality):
+    """Use the preview level of detail for ``quality``; returns the anchor count."""
+    anchors = LOD_COMPONENTS.get(quality, FULL_COMPONENTS)
+    defaults = list(_DEFAULTS)
+    defaults[_PARAMS.index("num_components")] = anchors
+    Arc.__init__.__defaults__ = tuple(defaults)
+    # Templates built at the other level of detail would be copied as they are
+    components.clear_templates()
+    return anchors
+
+
+def uninstall():
+    Arc.__init__.__defaults__ = _DEFAULTS
+    components.clear_templates()
+
+
+def scene_points(scene):
+    mobjects = extract_mobject_family_members(
+        list_update(scene.mobjects, scene.foreground_mobjects),
+        only_those_with_points=True,
+    )
+    return sum(len(mob.points) for mob in mobjects)
+
+
+class PointCountRenderer(NoDrawRenderer):
+    """Runs construct with animations skipped, counting points after each play."""
+
+    skip_all = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.plays = []
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        self.plays.append((scene.duration, scene_points(scene)))
+
+
+def point_counts(script, scene_name, quality, lod):
+    from manim import tempconfig
+
+    from render_all import load_script
+
+    if lod:
+        anchors = install(quality)
+    else:
+        # Pool workers are reused; undo an earlier install
+        uninstall()
+        anchors = FULL_COMPONENTS
+    scene_cls = getattr(load_script(script), scene_name)
+    with tempconfig(no_output_config(quality=quality)):
+        scene = scene_cls(renderer=PointCountRenderer())
+        scene.render()
+    plays = scene.renderer.plays
+    duration = sum(run_time for run_time, _ in plays)
+    return {
+        "components": anchors,
+        "peak": max((points for _, points in plays), default=0),
+        # Points on screen per frame, from the state at the end of each play
+        "per_frame": round(
+            sum(run_time * points for run_time, points in plays) / duration
+            if duration
+            else 0
+        ),
+    }
+
+
+def main(argv=None):
+    from render_all import QUALITY_FLAGS, discover_scenes
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scene", action="append", help="only these scenes")
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    args = parser.parse_args(argv)
+
+    quality = QUALITY_FLAGS[args.quality]
+    scenes = [
+        (path, name)
+        for path, name in discover_scenes()
+        if not args.scene or name in args.scene
+    ]
+    if not scenes:
+        parser.error("no scenes to count")
+
+    # Counts run in worker processes, so install() never patches this one
+    with ProcessPoolExecutor() as pool:
+        futures = [
+            (
+                name,
+                pool.submit(point_counts, path, name, quality, False),
+                pool.submit(point_counts, path, name, quality, True),
+            )
+            for path, name in scenes
+        ]
+        print(f"{'Scene':<34} {'Points/frame':>21} {'Peak points':>21}")
+        for name, full, reduced in futures:
+            full, reduced = full.result(), reduced.result()
+            saved = 100 * (1 - reduced["per_frame"] / max(full["per_frame"], 1))
+            print(
+                f"{name:<34} {full['per_frame']:>9} -> {reduced['per_frame']:<9}"
+                f" {full['peak']:>9} -> {reduced['peak']:<9} ({saved:.0f}% fewer)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Render several quality presets from a single run of ``construct``.
+
+``MultiResolutionRenderer`` renders the scene at the main quality as usual
+and, for every frame, also rasterizes the scene with one extra camera per
+preset. Each preset gets its own ffmpeg stream (see ``frame_stream``), so the
+scene logic, updaters and Bezier math run once however many files come out.
+
+Presets with a lower frame rate than the main quality take every n-th frame;
+the main quality must have the highest frame rate (render_all.py checks).
+
+Usage:
+
+    python render_all.py -q h --also-quality l m
+"""
+
+from manim import tempconfig
+from manim.camera.camera import Camera
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.iterables import list_update
+
+from frame_stream import StreamingFileWriter
+
+
+class PresetOutput:
+    def __init__(self, quality, scene_name, renderer):
+        self.quality = quality
+        # Cameras, movie paths and the encoder all read the preset from config
+        with tempconfig({"quality": quality}):
+            self.camera = Camera()
+            self.file_writer = StreamingFileWriter(renderer, scene_name)
+            self.file_writer.open_stream()
+        self.frames = 0
+        self.static_image = None
+
+    def capture(self, mobjects):
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+        self.camera.capture_mobjects(mobjects)
+
+    def sync(self, time, mobjects):
+        # Write as many frames as this preset's frame rate owes up to `time`
+        owed = round(time * self.camera.frame_rate) - self.frames
+        if owed <= 0:
+            return
+        self.capture(mobjects)
+        for _ in range(owed):
+            self.file_writer.write_frame(self.camera.pixel_array)
+        self.frames += owed
+
+    def finish(self):
+        with tempconfig({"quality": self.quality}):
+            self.file_writer.finish()
+
+
+class MultiResolutionRenderer(CairoRenderer):
+    extra_qualities = ()
+
+    def __init__(self, *args, extra_qualities=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if extra_qualities is not None:
+            self.extra_qualities = extra_qualities
+        self.presets = []
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.scene = scene
+        self.presets = [
+            PresetOutput(quality, type(scene).__name__, self)
+            for quality in self.extra_qualities
+        ]
+
+    @property
+    def extra_outputs(self):
+        return [str(preset.file_writer.movie_file_path) for preset in self.presets]
+
+    def _scene_mobjects(self, mobjects=None):
+        if mobjects:
+            return mobjects
+        return list_update(self.scene.mobjects, self.scene.foreground_mobjects)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        static_image = super().save_static_frame_data(scene, static_mobjects)
+        for preset in self.presets:
+            preset.static_image = None
+            if static_mobjects:
+                preset.capture(static_mobjects)
+                preset.static_image = preset.camera.pixel_array.copy()
+        return static_image
+
+    def render(self, scene, time, moving_mobjects):
+        super().render(scene, time, moving_mobjects)
+        if self.skip_animations:
+            return
+        mobjects = self._scene_mobjects(moving_mobjects)
+        for preset in self.presets:
+            preset.sync(self.time, mobjects)
+
+    def freeze_current_frame(self, duration):
+        super().freeze_current_frame(duration)
+        if self.skip_animations:
+            return
+        mobjects = self._scene_mobjects(self.scene.moving_mobjects)
+        for preset in self.presets:
+            preset.sync(self.time, mobjects)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        for preset in self.presets:
+            preset.finish()
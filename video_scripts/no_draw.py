@@ -0,0 +1,50 @@
+"""Base renderer for the modes that run ``construct`` without drawing frames.
+
+Dry runs, timeline recording, storyboards, shard planning (``shard.py``) and
+point counting (``lod.py``) all step through a scene for what happens in it,
+not for its pixels. ``NoDrawRenderer`` keeps manim's clock and play
+bookkeeping but never rasterizes a frame or a static background, and
+``no_output_config`` is the matching ``tempconfig`` that writes no movie, no
+last frame and no partial-movie cache.
+"""
+
+from manim.renderer.cairo_renderer import CairoRenderer
+
+
+def no_output_config(**overrides):
+    return {
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        **overrides,
+    }
+
+
+class NoDrawRenderer(CairoRenderer):
+    # Skip every animation to its end state instead of stepping its frames
+    skip_all = False
+
+    def __init__(self, *args, **kwargs):
+        if self.skip_all:
+            kwargs["skip_animations"] = True
+        super().__init__(*args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    # Frames advance the clock but are never drawn
+    def render(self, scene, time, moving_mobjects):
+        self.advance(1)
+
+    def freeze_current_frame(self, duration):
+        self.advance(int(duration * self.camera.frame_rate))
+
+    def advance(self, frames):
+        # Skipped plays are accounted for by CairoRenderer.play
+        if not self.skip_animations:
+            self.time += frames / self.camera.frame_rate
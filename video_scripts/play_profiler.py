@@ -0,0 +1,116 @@
+"""Opt-in per-play() profiling hook.
+
+Records, for every ``self.play``/``self.wait`` call, the source line that
+issued it, the animation count, the number of mobjects and Bezier curves in
+the scene afterwards and the wall time spent. At the end of the scene the
+records are written as
+
+* ``<Scene>.folded``: folded stacks (``frame;frame;frame microseconds``) for
+  flamegraph.pl, speedscope or inferno, and
+* ``<Scene>.plays.json``: the full per-call records.
+
+Enable it with ``render_all.py --profile-plays DIR`` or by rendering a scene
+with ``PlayProfilerRenderer(profile_dir=DIR)``.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from manim import Wait, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+
+MANIM_DIR = str(Path(sys.modules["manim"].__file__).parent)
+TOOL_FILES = {__file__}
+
+
+def scene_stack(scene):
+    # Frames from the scene's own code, outermost first (construct, helpers)
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(MANIM_DIR) and filename not in TOOL_FILES:
+            if frame.f_locals.get("self") is scene or frames:
+                code = frame.f_code
+                frames.append((Path(filename).name, code.co_name, frame.f_lineno))
+        if frame.f_code.co_name == "render" and frame.f_locals.get("self") is scene:
+            break
+        frame = frame.f_back
+    return frames[::-1]
+
+
+def scene_counts(scene):
+    family = scene.get_mobject_family_members()
+    points = sum(len(mob.points) for mob in family)
+    return {
+        "mobjects": len(family),
+        "points": points,
+        # Cairo VMobjects store four control points per cubic Bezier curve
+        "bezier_curves": points // 4,
+    }
+
+
+class PlayProfilerRenderer(CairoRenderer):
+    profile_dir = "profiles"
+
+    def __init__(self, *args, profile_dir=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if profile_dir is not None:
+            self.profile_dir = profile_dir
+        self.play_records = []
+
+    def play(self, scene, *args, **kwargs):
+        stack = [
+            (name, func, line)
+            for name, func, line in scene_stack(scene)
+            if func not in ("play", "wait")
+        ]
+        start = time.perf_counter()
+        super().play(scene, *args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        animations = scene.animations or []
+        if len(animations) == 1 and isinstance(animations[0], Wait):
+            call = "wait"
+        else:
+            call = "play"
+        source = f"{stack[-1][0]}:{stack[-1][2]}" if stack else "?"
+        record = {
+            "index": len(self.play_records),
+            "call": call,
+            "source": source,
+            "stack": [f"{func} ({name}:{line})" for name, func, line in stack],
+            "animations": [type(anim).__name__ for anim in animations],
+            "animation_count": len(animations),
+            **scene_counts(scene),
+            "seconds": round(seconds, 4),
+        }
+        self.play_records.append(record)
+        logger.info(
+            "%(call)s #%(index)d at %(source)s: %(animation_count)d animations, "
+            "%(mobjects)d mobjects, %(bezier_curves)d curves, %(seconds).3fs",
+            record,
+        )
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        self.write_profile(type(scene).__name__)
+
+    def write_profile(self, scene_name):
+        out_dir = Path(self.profile_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        lines = []
+        for record in self.play_records:
+            label = record["call"]
+            if record["call"] == "play":
+                label += "(" + ", ".join(sorted(set(record["animations"]))) + ")"
+            frames = [scene_name, *record["stack"], f"{label} @{record['source']}"]
+            # Folded stack frames may not contain ';'
+            frames = [frame.replace(";", ",") for frame in frames]
+            lines.append(f"{';'.join(frames)} {int(record['seconds'] * 1e6)}")
+        (out_dir / f"{scene_name}.folded").write_text("\n".join(lines) + "\n")
+        (out_dir / f"{scene_name}.plays.json").write_text(
+            json.dumps(self.play_records, indent=2)
+        )
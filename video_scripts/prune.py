@@ -0,0 +1,114 @@
+"""Skip invisible mobjects when drawing frames.
+
+Scenes often leave dead objects behind: pulses faded to opacity 0, copies
+transformed into something else, objects faded out but never removed.
+Manim still rasterizes all of them on every frame. ``PruningRenderer``
+filters the draw list before each frame and leaves out family members that
+are
+
+* fully transparent (no visible fill, stroke or background stroke),
+* zero-size (all points in one place), or
+* entirely outside the camera frame.
+
+Nothing is removed from the scene, so a pruned object that fades back in or
+moves into view is drawn again. Enable it with ``render_all.py --prune``;
+the number of pruned mobjects is reported per scene.
+"""
+
+import numpy as np
+from manim import ImageMobject, PMobject, VMobject, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+# Margin around the frame for stroke widths and arrow tips
+FRAME_MARGIN = 0.1
+
+
+def is_transparent(mob):
+    if isinstance(mob, VMobject):
+        if np.any(mob.get_fill_rgbas()[:, 3] > 0):
+            return False
+        for background in (False, True):
+            width = mob.get_stroke_width(background)
+            if width > 0 and np.any(mob.get_stroke_rgbas(background)[:, 3] > 0):
+                return False
+        return True
+    if isinstance(mob, PMobject):
+        return not np.any(mob.rgbas[:, 3] > 0)
+    if isinstance(mob, ImageMobject):
+        return getattr(mob, "fill_opacity", 1) == 0
+    return False
+
+
+class PruningRenderer(CairoRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pruned_ids = set()
+        self.pruned_draws = 0
+        self.drawn = 0
+
+    def is_visible(self, mob):
+        if is_transparent(mob):
+            return False
+        points = mob.points
+        if isinstance(mob, VMobject) and np.ptp(points, axis=0).max() == 0:
+            return False
+        # Off-frame: the bounding box misses the frame entirely
+        camera = self.camera
+        center = camera.frame_center
+        half = np.array([camera.frame_width, camera.frame_height]) / 2
+        low = points[:, :2].min(axis=0) - center[:2]
+        high = points[:, :2].max(axis=0) - center[:2]
+        return bool(np.all(high >= -half - FRAME_MARGIN)) and bool(
+            np.all(low <= half + FRAME_MARGIN)
+        )
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, **kwargs):
+        if self.skip_animations and not kwargs.get("ignore_skipping", True):
+            return
+        if not mobjects:
+            mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        if include_submobjects:
+            mobjects = extract_mobject_family_members(
+                mobjects,
+                use_z_index=self.camera.use_z_index,
+                only_those_with_points=True,
+            )
+        visible = []
+        for mob in mobjects:
+            if self.is_visible(mob):
+                visible.append(mob)
+            else:
+                self.pruned_ids.add(id(mob))
+                self.pruned_draws += 1
+        self.drawn += len(visible)
+        if not visible:
+            # Nothing to draw; an empty list would mean "everything" upstream
+            if self.static_image is not None:
+                self.camera.set_frame_to_background(self.static_image)
+            else:
+                self.camera.reset()
+            return
+        super().update_frame(scene, visible, include_submobjects=False, **kwargs)
+
+    def prune_stats(self):
+        total = self.drawn + self.pruned_draws
+        return {
+            "mobjects": len(self.pruned_ids),
+            "draws_skipped": self.pruned_draws,
+            "draws_skipped_pct": (
+                round(100 * self.pruned_draws / total, 1) if total else 0.0
+            ),
+        }
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        stats = self.prune_stats()
+        logger.info(
+            "%s: pruned %d mobjects, skipped %d of %d draws",
+            type(scene).__name__,
+            stats["mobjects"],
+            self.pruned_draws,
+            self.drawn + self.pruned_draws,
+        )
@@ -0,0 +1,577 @@
+"""Render every Scene in video_scripts/ in parallel.
+
+Usage:
+
+    python render_all.py -q h -j 4
+    python render_all.py -q l --scene AttentionMechanism --report report.json
+
+Scenes whose code has not changed since their last render are restored from
+the render cache instead of being rendered again (disable with --no-cache).
+
+Render modes (e.g. --freeze-holds, --storyboard, --also-quality) swap in renderer and file writer
+subclasses; see make_renderer. --export-timeline records scenes for replay
+with timeline.py.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+
+from render_cache import DEFAULT_CACHE_DIR, RenderCache, scene_cache_key
+from scene_index import index_scenes
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Modes that write something besides the movie (profiles, keyframes, extra
+# presets) or return per-run data (frame hashes, timings); the render cache
+# only restores the movie, so these always render
+SIDE_OUTPUT_OPTIONS = (
+    "benchmark",
+    "profile_plays",
+    "storyboard",
+    "timeline",
+    "dry_run",
+    "extra_qualities",
+    "deterministic",
+)
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_script(path):
+    # Scripts are not a package and some names (auto-regression.py) are not
+    # valid identifiers, so load them straight from their file path.
+    path = Path(path).resolve()
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    module_name = "video_scripts." + path.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover_scenes(scripts_dir=SCRIPTS_DIR):
+    # Static discovery; manim and the scripts are only imported by the
+    # workers that render them
+    return [(scene["path"], scene["scene"]) for scene in index_scenes(scripts_dir)]
+
+
+def make_renderer(options):
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    # Each mode contributes CairoRenderer / SceneFileWriter subclasses which
+    # are combined into one class, so modes can be mixed freely.
+    renderer_bases, writer_bases, attrs = [], [], {}
+    if options.get("benchmark"):
+        from benchmark import BenchmarkFileWriter, BenchmarkRenderer
+
+        renderer_bases.append(BenchmarkRenderer)
+        writer_bases.append(BenchmarkFileWriter)
+    if options.get("freeze_holds"):
+        from freeze_frames import FreezeFrameFileWriter, FreezeFrameRenderer
+
+        renderer_bases.append(FreezeFrameRenderer)
+        writer_bases.append(FreezeFrameFileWriter)
+    if options.get("stream"):
+        from frame_stream import StreamingFileWriter
+
+        writer_bases.append(StreamingFileWriter)
+    if options.get("profile_plays"):
+        from play_profiler import PlayProfilerRenderer
+
+        renderer_bases.append(PlayProfilerRenderer)
+        attrs["profile_dir"] = options["profile_plays"]
+    if options.get("deterministic"):
+        from frame_hashes import FrameHashRenderer
+
+        renderer_bases.append(FrameHashRenderer)
+    if options.get("prune"):
+        from prune import PruningRenderer
+
+        renderer_bases.append(PruningRenderer)
+    if options.get("static_layers"):
+        from static_layers import StaticLayerRenderer
+
+        renderer_bases.append(StaticLayerRenderer)
+    if options.get("extra_qualities"):
+        from multi_res import MultiResolutionRenderer
+
+        renderer_bases.append(MultiResolutionRenderer)
+        attrs["extra_qualities"] = options["extra_qualities"]
+    if options.get("storyboard"):
+        from storyboard import StoryboardRenderer
+
+        renderer_bases.append(StoryboardRenderer)
+        attrs["storyboard_dir"] = options["storyboard"]
+    if options.get("dry_run"):
+        from dry_run import DryRunRenderer
+
+        renderer_bases.append(DryRunRenderer)
+    if options.get("timeline"):
+        from timeline import TimelineRecorder
+
+        renderer_bases.append(TimelineRecorder)
+        attrs["timeline_dir"] = options["timeline"]
+
+    renderer_cls = type("RenderRenderer", (*renderer_bases, CairoRenderer), attrs)
+    writer_cls = type("RenderFileWriter", (*writer_bases, SceneFileWriter), {})
+    return renderer_cls(file_writer_class=writer_cls)
+
+
+def render_scene(script, scene_name, quality, media_dir, options=None):
+    from manim import tempconfig
+
+    options = options or {}
+
+    result = {"script": Path(script).name, "scene": scene_name, "output": None}
+    start = time.perf_counter()
+    try:
+        # Shards of one scene run in separate processes and must draw the
+        # same random values as a serial render
+        seeded = options.get("deterministic") or options.get("play_range")
+        if seeded:
+            from frame_hashes import seed_everything
+
+            # Seed before the script is loaded, for module-level randomness too
+            seed_everything(scene_name)
+        if options.get("lod"):
+            import lod
+
+            # Before the script runs, so module-level shapes are reduced too
+            result["lod_components"] = lod.install(quality)
+        module = load_script(script)
+        if options.get("text_cache"):
+            import text_cache
+
+            text_cache.install(module)
+        scene_cls = getattr(module, scene_name)
+        overrides = {
+            "quality": quality,
+            "input_file": str(script),
+            "media_dir": str(media_dir),
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+        }
+        uncached = ("benchmark", "profile_plays", "stream", "extra_qualities")
+        if any(options.get(o) for o in uncached):
+            # Manim's partial-movie cache would skip the work being measured
+            # or profiled, and streamed movies have no partial movies to reuse
+            overrides["disable_caching"] = True
+        if options.get("play_range"):
+            # Only plays first_play..end_play-1 (end_play None: to the last
+            # one) are drawn; earlier plays are fast-forwarded to their end
+            # state
+            first_play, end_play = options["play_range"]
+            last = "" if end_play is None else end_play - 1
+            overrides.update(
+                from_animation_number=first_play,
+                upto_animation_number=-1 if end_play is None else end_play - 1,
+                output_file=f"{scene_name}_plays{first_play}-{last}",
+                disable_caching=True,
+            )
+        if any(options.get(o) for o in ("storyboard", "timeline", "dry_run")):
+            # Keyframes, a timeline or nothing at all: no movie, no partial
+            # movies and no last frame
+            from no_draw import no_output_config
+
+            overrides.update(no_output_config())
+        if seeded:
+            # And again for construct, in case a reused worker had the script
+            # loaded already
+            seed_everything(scene_name)
+        with tempconfig(overrides):
+            scene = scene_cls(renderer=make_renderer(options))
+            render_start = time.perf_counter()
+            scene.render()
+            render_seconds = time.perf_counter() - render_start
+            output = getattr(scene.renderer, "output_path", None)
+            if output is None and not options.get("dry_run"):
+                output = scene.renderer.file_writer.movie_file_path
+            result["output"] = str(output) if output is not None else None
+            if options.get("extra_qualities"):
+                result["extra_outputs"] = scene.renderer.extra_outputs
+        if options.get("benchmark"):
+            result["phases"] = scene.renderer.timings.report(render_seconds)
+        if options.get("text_cache"):
+            result["text_cache"] = text_cache.default_cache.stats()
+        if options.get("prune"):
+            result["pruned"] = scene.renderer.prune_stats()
+        if options.get("dry_run"):
+            result["dry_run"] = scene.renderer.dry_run_stats()
+        if options.get("static_layers"):
+            result["static_layers"] = scene.renderer.layer_stats()
+        if options.get("deterministic"):
+            result["frame_hashes"] = scene.renderer.frame_hashes
+            result["invalid_segments"] = len(scene.renderer.invalid_segments)
+            if result["invalid_segments"]:
+                # They are already part of this movie; they have been deleted,
+                # so rendering again encodes them afresh
+                result["output"] = None
+                result["error"] = (
+                    f"{result['invalid_segments']} stale cached segments were "
+                    "used in this movie and have been dropped; render again\n"
+                )
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["seconds"] = round(time.perf_counter() - start, 2)
+    return result
+
+
+def pool_results(pending, quality, media_dir, options, workers, render=None):
+    if render is not None:
+        # The render callable starts the worker processes; threads just wait
+        pool = ThreadPoolExecutor(max_workers=workers)
+        task = render
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        task = render_scene
+    with pool:
+        futures = [
+            pool.submit(task, script, name, quality, media_dir, options)
+            for script, name in pending
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def render_all(
+    scenes,
+    quality,
+    media_dir,
+    workers,
+    cache=None,
+    options=None,
+    render=None,
+    render_many=None,
+):
+    # render: called like render_scene, from a thread, instead of rendering in
+    # a fresh worker process (e.g. to go through a warm render server).
+    # render_many: called from this thread with the (script, scene) pairs to
+    # render and the rest of render_scene's arguments plus the worker count;
+    # yields the results as the scenes finish (e.g. workers forked from here).
+    options = options or {}
+    results = []
+    batch_start = time.perf_counter()
+    if any(options.get(o) for o in SIDE_OUTPUT_OPTIONS):
+        cache = None
+
+    keys, pending = {}, []
+    for script, name in scenes:
+        if cache is not None:
+            extra = [("media_dir", str(Path(media_dir).resolve()))]
+            extra += sorted(options.items())
+            keys[name] = scene_cache_key(script, name, quality, extra)
+            if cache.lookup(keys[name]) is not None:
+                output = cache.restore(keys[name])
+                print(f"[cached] {name}")
+                results.append(
+                    {
+                        "script": Path(script).name,
+                        "scene": name,
+                        "output": str(output),
+                        "seconds": 0.0,
+                        "cached": True,
+                    }
+                )
+                continue
+        pending.append((script, name))
+
+    if pending:
+        max_workers = min(workers, len(pending))
+        if render_many is not None:
+            finished = render_many(pending, quality, media_dir, options, max_workers)
+        else:
+            finished = pool_results(
+                pending, quality, media_dir, options, max_workers, render
+            )
+        for result in finished:
+            status = "FAILED" if "error" in result else "done"
+            print(f"[{status}] {result['scene']} ({result['seconds']}s)")
+            if cache is not None and result["output"]:
+                key = keys[result["scene"]]
+                cache.store(key, result["scene"], result["output"])
+            results.append(result)
+    return {
+        "quality": quality,
+        "workers": workers,
+        "total_seconds": round(time.perf_counter() - batch_start, 2),
+        "scenes": sorted(results, key=lambda r: r["seconds"], reverse=True),
+    }
+
+
+def print_report(report):
+    print()
+    print(f"{'Scene':<34} {'Time (s)':>9}  Output")
+    for result in report["scenes"]:
+        output = result["output"] or ("dry run" if "dry_run" in result else "FAILED")
+        if result.get("cached"):
+            output += " (cached)"
+        print(f"{result['scene']:<34} {result['seconds']:>9.2f}  {output}")
+        for extra in result.get("extra_outputs", []):
+            print(f"{'':<34} {'':>9}  {extra}")
+        if "text_cache" in result:
+            print(f"{'':<34} {'':>9}  text cache: {result['text_cache']}")
+        if "pruned" in result:
+            print(f"{'':<34} {'':>9}  pruned: {result['pruned']}")
+        if "dry_run" in result:
+            stats = result["dry_run"]
+            print(
+                f"{'':<34} {'':>9}  {stats['duration']:.1f}s, {stats['plays']} "
+                f"plays, {stats['waits']} waits, "
+                f"peak {stats['peak_mobjects']} mobjects"
+            )
+            for issue in stats["issues"]:
+                print(
+                    f"{'':<34} {'':>9}  play #{issue['play']} {issue['source']}: "
+                    f"{issue['message']}"
+                )
+        if "static_layers" in result:
+            print(f"{'':<34} {'':>9}  static layers: {result['static_layers']}")
+    print(
+        f"\nRendered {len(report['scenes'])} scenes with {report['workers']} "
+        f"workers in {report['total_seconds']:.2f}s"
+    )
+    for result in report["scenes"]:
+        if "error" in result:
+            print(f"\n{result['scene']} failed:\n{result['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="h")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=os.cpu_count(), help="render processes"
+    )
+    parser.add_argument(
+        "--scene", action="append", help="only render these scenes (repeatable)"
+    )
+    parser.add_argument("--media-dir", default=str(SCRIPTS_DIR / "media"))
+    parser.add_argument("--report", help="write the JSON report to this path")
+    parser.add_argument("--no-cache", action="store_true", help="render every scene")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR))
+    parser.add_argument(
+        "--cache-size", type=int, default=2048, help="cache size limit in MB"
+    )
+    parser.add_argument(
+        "--freeze-holds",
+        action="store_true",
+        help="encode static self.wait() holds from a single frame",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="pipe frames into one encoder per scene instead of partial movies",
+    )
+    parser.add_argument(
+        "--text-cache",
+        action="store_true",
+        help="reuse parsed Text/MathTex geometry across scenes and renders",
+    )
+    parser.add_argument(
+        "--profile-plays",
+        metavar="DIR",
+        help="write per-play() timings and folded stacks for flame graphs to DIR",
+    )
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="seed random/NumPy per scene and hash the end frame of every play()",
+    )
+    parser.add_argument(
+        "--golden", metavar="PATH", help="compare frame hashes with a golden file"
+    )
+    parser.add_argument(
+        "--save-golden", metavar="PATH", help="store this run's frame hashes"
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="skip transparent, zero-size and off-frame mobjects when drawing",
+    )
+    parser.add_argument(
+        "--lod",
+        action="store_true",
+        help="build arcs and circles with fewer anchors in -ql/-qm previews",
+    )
+    parser.add_argument(
+        "--static-layers",
+        action="store_true",
+        help="draw static mobjects once per play() and composite them per frame",
+    )
+    parser.add_argument(
+        "--also-quality",
+        nargs="+",
+        default=[],
+        choices=QUALITY_FLAGS,
+        help="also write these presets from the same construct run",
+    )
+    parser.add_argument(
+        "--server",
+        nargs="?",
+        const=str(SCRIPTS_DIR / ".render_server.sock"),
+        metavar="ADDRESS",
+        help="render through a running render_server.py instead of new processes",
+    )
+    parser.add_argument(
+        "--storyboard",
+        metavar="DIR",
+        help="write one keyframe PNG per play() and an index.html to DIR, no video",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="run construct without drawing; report duration, counts and layout",
+    )
+    parser.add_argument(
+        "--export-timeline",
+        metavar="DIR",
+        help="record each scene to DIR/<Scene>.npz for timeline.py, no video",
+    )
+    args = parser.parse_args(argv)
+    if args.stream and args.freeze_holds:
+        parser.error("--freeze-holds writes partial movies and cannot be streamed")
+    if args.freeze_holds and args.also_quality:
+        # Frozen holds never reach the extra presets' writers, which would
+        # come out shorter than the main movie
+        parser.error("--freeze-holds cannot be combined with --also-quality")
+    if args.also_quality:
+        from manim.constants import QUALITIES
+
+        fps = QUALITIES[QUALITY_FLAGS[args.quality]]["frame_rate"]
+        faster = [
+            q
+            for q in args.also_quality
+            if QUALITIES[QUALITY_FLAGS[q]]["frame_rate"] > fps
+        ]
+        if faster:
+            # Their extra frames could only repeat the main quality's frames
+            parser.error(
+                f"--also-quality {' '.join(faster)} has a higher frame rate than "
+                f"-q {args.quality}; use the highest frame rate for -q"
+            )
+    if args.storyboard and (args.stream or args.freeze_holds or args.also_quality):
+        parser.error("--storyboard writes no video to stream, freeze or resize")
+    if args.static_layers and (args.prune or args.storyboard or args.also_quality):
+        parser.error(
+            "--static-layers draws frames itself; "
+            "drop --prune/--storyboard/--also-quality"
+        )
+    golden = args.golden or args.save_golden
+    if args.export_timeline and (
+        args.storyboard
+        or args.stream
+        or args.freeze_holds
+        or args.also_quality
+        or args.deterministic
+        or args.static_layers
+        or golden
+    ):
+        parser.error("--export-timeline draws no frames to encode, resize or hash")
+
+    drawing = [
+        args.stream,
+        args.freeze_holds,
+        args.also_quality,
+        args.storyboard,
+        args.export_timeline,
+        args.static_layers,
+        args.prune,
+        args.deterministic,
+        golden,
+    ]
+    if args.dry_run and any(drawing):
+        parser.error("--dry-run draws nothing and cannot be combined with other modes")
+
+    scenes = discover_scenes()
+    if args.scene:
+        scenes = [(path, name) for path, name in scenes if name in args.scene]
+    if not scenes:
+        parser.error("no scenes to render")
+
+    cache = None
+    # The render cache stores one movie per scene; storyboards and timelines
+    # are not movies, multi-resolution runs write several movies and golden
+    # checks need the frame hashes of a real render
+    no_movie = args.storyboard or args.export_timeline or args.dry_run
+    if not (args.no_cache or no_movie or args.also_quality or golden):
+        cache = RenderCache(args.cache_dir, args.cache_size * 1024**2)
+
+    workers = max(1, min(args.workers, len(scenes)))
+    options = {
+        "freeze_holds": args.freeze_holds,
+        "stream": args.stream,
+        "text_cache": args.text_cache,
+        "profile_plays": args.profile_plays,
+        "storyboard": args.storyboard,
+        "timeline": args.export_timeline,
+        "dry_run": args.dry_run,
+        "prune": args.prune,
+        "static_layers": args.static_layers,
+        "lod": args.lod,
+        "deterministic": bool(args.deterministic or golden),
+        "extra_qualities": [
+            QUALITY_FLAGS[q] for q in args.also_quality if q != args.quality
+        ],
+    }
+    render = None
+    if args.server:
+        from render_server import render_remote
+
+        render = partial(render_remote, args.server)
+    report = render_all(
+        scenes,
+        QUALITY_FLAGS[args.quality],
+        args.media_dir,
+        workers,
+        cache,
+        options,
+        render,
+    )
+    print_report(report)
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2))
+    failed = any("error" in r for r in report["scenes"])
+
+    if args.save_golden:
+        path = Path(args.save_golden)
+        hashes = json.loads(path.read_text()) if path.exists() else {}
+        for result in report["scenes"]:
+            if "frame_hashes" in result:
+                hashes[result["scene"]] = result["frame_hashes"]
+        path.write_text(json.dumps(hashes, indent=2))
+        print(f"\nFrame hashes saved to {path}")
+    elif args.golden:
+        from frame_hashes import compare_golden
+
+        mismatches = compare_golden(
+            report["scenes"], json.loads(Path(args.golden).read_text())
+        )
+        print()
+        for scene, index, old, new in mismatches:
+            print(f"CHANGED {scene} play #{index}: {old} -> {new}")
+        if not mismatches:
+            print("All frames match the golden hashes")
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Persistent cache of rendered scene videos.
+
+A scene is keyed by the AST of its class (``construct`` plus every helper
+method), the module-level code of its script, any local modules the script
+imports, the quality preset and the installed manim version. Comments and
+formatting changes do not affect the key, so only scenes whose code really
+changed are rendered again.
+"""
+
+import ast
+import hashlib
+import json
+import shutil
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".render_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def manim_version():
+    try:
+        return version("manim")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _is_main_guard(node):
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+def _local_modules(tree, scripts_dir):
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return sorted(
+        scripts_dir / f"{name}.py"
+        for name in names
+        if (scripts_dir / f"{name}.py").exists()
+    )
+
+
+def _class_nodes(tree, scene_name):
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    if scene_name not in classes:
+        raise KeyError(f"{scene_name} is not defined at the top level of the script")
+
+    # Include base classes defined in the same script, e.g. a shared Scene base
+    nodes, pending = [], [scene_name]
+    while pending:
+        name = pending.pop()
+        if name not in classes or classes[name] in nodes:
+            continue
+        nodes.append(classes[name])
+        pending.extend(b.id for b in classes[name].bases if isinstance(b, ast.Name))
+    return nodes
+
+
+def scene_fingerprint(script, scene_name):
+    script = Path(script).resolve()
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+    parts = [ast.dump(node) for node in _class_nodes(tree, scene_name)]
+    parts += [
+        ast.dump(node)
+        for node in tree.body
+        if not isinstance(node, ast.ClassDef) and not _is_main_guard(node)
+    ]
+
+    # Helper modules next to the script (and their own local imports)
+    seen = {script}
+    pending = _local_modules(tree, script.parent)
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        module_tree = ast.parse(path.read_text(encoding="utf-8"))
+        parts.append(f"{path.name}:{ast.dump(module_tree)}")
+        pending.extend(_local_modules(module_tree, script.parent))
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def scene_cache_key(script, scene_name, quality, extra=()):
+    payload = [scene_fingerprint(script, scene_name), quality, manim_version()]
+    payload.extend(str(item) for item in extra)
+    return hashlib.sha256("|".join(payload).encode()).hexdigest()[:32]
+
+
+class RenderCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.index_path = self.cache_dir / "index.json"
+        self.index = self._load_index()
+
+    def _load_index(self):
+        if not self.index_path.exists():
+            return {}
+        try:
+            index = json.loads(self.index_path.read_text())
+        except ValueError:
+            return {}
+        # Drop entries whose blobs were deleted behind our back
+        return {
+            key: entry
+            for key, entry in index.items()
+            if (self.cache_dir / entry["blob"]).exists()
+        }
+
+    def _save_index(self):
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.index, indent=2))
+        tmp_path.replace(self.index_path)
+
+    def total_bytes(self):
+        return sum(entry["size"] for entry in self.index.values())
+
+    def lookup(self, key):
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        entry["last_used"] = time.time()
+        self._save_index()
+        return entry
+
+    def restore(self, key, output=None):
+        # Always copy: other render modes write different movies to the same
+        # output path, possibly of the same size
+        entry = self.index[key]
+        output = Path(output or entry["output"])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(self.cache_dir / entry["blob"], output)
+        return output
+
+    def store(self, key, scene_name, output):
+        output = Path(output)
+        blob = f"{key}{output.suffix}"
+        shutil.copy2(output, self.cache_dir / blob)
+        self.index[key] = {
+            "scene": scene_name,
+            "blob": blob,
+            "output": str(output),
+            "size": output.stat().st_size,
+            "last_used": time.time(),
+        }
+        self._evict()
+        self._save_index()
+
+    def _evict(self):
+        # Least recently used entries go first
+        for key in sorted(self.index, key=lambda k: self.index[k]["last_used"]):
+            if self.total_bytes() <= self.max_bytes:
+                break
+            entry = self.index.pop(key)
+            (self.cache_dir / entry["blob"]).unlink(missing_ok=True)
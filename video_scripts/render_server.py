@@ -0,0 +1,181 @@
+"""Resident render server that forks a pre-warmed worker per render.
+
+Importing manim, discovering fonts and setting up LaTeX take seconds, which
+dominates quick low-quality previews. The server does all of that once, then
+waits on a Unix socket and forks a child for every render request. Each child
+starts with manim loaded and warm, loads the (possibly just edited) scene
+script itself and sends the result back.
+
+Usage:
+
+    python render_server.py &                     # start the server
+    python render_all.py -ql --server --scene EnhancedWordEmbeddingAnimation
+    python render_server.py --stop
+"""
+
+import argparse
+import os
+import signal
+import sys
+import time
+from multiprocessing import Pipe
+from multiprocessing.connection import Client, Listener, wait
+
+from render_all import SCRIPTS_DIR
+
+DEFAULT_ADDRESS = str(SCRIPTS_DIR / ".render_server.sock")
+AUTHKEY = b"render_all"
+
+# Options holding paths; the server resolves relative paths against its own cwd
+PATH_OPTIONS = ("storyboard", "profile_plays", "timeline")
+
+
+def warm_up(media_dir):
+    # Everything here is inherited by the forked workers
+    import manimpango
+    from manim import MathTex, Tex, Text, tempconfig
+
+    manimpango.list_fonts()
+    with tempconfig({"media_dir": str(media_dir), "verbosity": "WARNING"}):
+        Text("Warm up")
+        # Compiles the default TeX template and caches the SVGs in media_dir
+        MathTex(r"x = \frac{1}{2}")
+        Tex("Warm up")
+
+
+def handle(conn):
+    from render_all import render_scene
+
+    request = conn.recv()
+    result = render_scene(
+        request["script"],
+        request["scene"],
+        request["quality"],
+        request["media_dir"],
+        request["options"],
+    )
+    conn.send(result)
+
+
+def start_fork(script, scene_name, quality, media_dir, options=None):
+    """Fork a child that renders the scene; returns (pid, connection).
+
+    Only call this from a single-threaded process: a forked child keeps any
+    lock another thread happened to hold and can deadlock on it.
+    """
+    from render_all import render_scene
+
+    parent_conn, child_conn = Pipe(duplex=False)
+    pid = os.fork()
+    if pid == 0:
+        parent_conn.close()
+        try:
+            child_conn.send(
+                render_scene(script, scene_name, quality, media_dir, options)
+            )
+        finally:
+            os._exit(0)
+    child_conn.close()
+    return pid, parent_conn
+
+
+def collect(pid, conn, script, scene_name):
+    try:
+        return conn.recv()
+    except EOFError:
+        return {
+            "script": os.path.basename(script),
+            "scene": scene_name,
+            "output": None,
+            "error": "render worker exited without a result",
+            "seconds": 0.0,
+        }
+    finally:
+        conn.close()
+        os.waitpid(pid, 0)
+
+
+def fork_renders(scenes, quality, media_dir, options=None, workers=1):
+    """Render (script, scene) pairs in up to ``workers`` forked children.
+
+    Children are forked and waited for from the calling thread, without a
+    thread pool; yields the results as the renders finish (a render_many for
+    render_all.render_all).
+    """
+    todo, running = list(scenes), {}
+    while todo or running:
+        while todo and len(running) < workers:
+            script, name = todo.pop(0)
+            pid, conn = start_fork(script, name, quality, media_dir, options)
+            running[conn] = (pid, script, name)
+        for conn in wait(list(running)):
+            pid, script, name = running.pop(conn)
+            yield collect(pid, conn, script, name)
+
+
+def serve(address=DEFAULT_ADDRESS, media_dir=SCRIPTS_DIR / "media"):
+    start = time.perf_counter()
+    warm_up(media_dir)
+    print(f"Warmed up in {time.perf_counter() - start:.1f}s", flush=True)
+
+    if os.path.exists(address):
+        os.unlink(address)
+    # Children are reaped automatically
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    with Listener(address, family="AF_UNIX", authkey=AUTHKEY) as listener:
+        print(f"Listening on {address}", flush=True)
+        while True:
+            conn = listener.accept()
+            if conn.recv() == "stop":
+                conn.close()
+                break
+            if os.fork() == 0:
+                listener.close()
+                # The worker waits on its own ffmpeg children
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                try:
+                    handle(conn)
+                finally:
+                    os._exit(0)
+            conn.close()
+    if os.path.exists(address):
+        os.unlink(address)
+
+
+def render_remote(address, script, scene_name, quality, media_dir, options=None):
+    # Same signature and result as render_all.render_scene
+    options = dict(options or {})
+    for name in PATH_OPTIONS:
+        if options.get(name):
+            options[name] = os.path.abspath(options[name])
+    with Client(address, family="AF_UNIX", authkey=AUTHKEY) as conn:
+        conn.send("render")
+        conn.send(
+            {
+                "script": os.path.abspath(script),
+                "scene": scene_name,
+                "quality": quality,
+                "media_dir": os.path.abspath(media_dir),
+                "options": options,
+            }
+        )
+        return conn.recv()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--address", default=DEFAULT_ADDRESS)
+    parser.add_argument("--media-dir", default=str(SCRIPTS_DIR / "media"))
+    parser.add_argument("--stop", action="store_true", help="stop a running server")
+    args = parser.parse_args(argv)
+
+    if args.stop:
+        with Client(args.address, family="AF_UNIX", authkey=AUTHKEY) as conn:
+            conn.send("stop")
+        return 0
+    serve(args.address, args.media_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
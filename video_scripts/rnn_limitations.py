@@ -1,18 +1,15 @@
 import numpy as np
 from manim import *
 
+from components import hidden_state, token_box
+
 
 class RNNLimitationsAnimation(Scene):
     def create_token_box(self, text, color=WHITE):
-        token = Text(text, font_size=24)
-        box = SurroundingRectangle(token, color=color, corner_radius=0.1)
-        return VGroup(token, box)
+        return token_box(text, color)
 
     def create_hidden_state(self, label="h", color=BLUE):
-        circle = Circle(radius=0.3, color=color)
-        text = MathTex(label, color=color)
-        text.move_to(circle.get_center())
-        return VGroup(circle, text)
+        return hidden_state(label, color)
 
     def create_timeline_marker(self, time, color=GRAY):
         line = Line(UP * 0.2, DOWN * 0.2, color=color)
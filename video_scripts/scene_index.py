@@ -0,0 +1,240 @@
+"""List the Scenes in video_scripts/ without importing manim.
+
+Scenes are found by parsing the scripts: any class deriving from ``Scene``
+(or another manim ``*Scene``, or a scene class defined earlier in the same
+file). Durations are estimated from literal ``run_time=`` and ``self.wait()``
+values in ``construct`` and the scene's own helper methods, with
+``for ... in range(<literal>)`` loops multiplied out. Estimates marked ``~``
+hit something that cannot be evaluated statically (a computed run_time, an
+unbounded loop, an ``if``), where the default of one second per call or the
+longer branch is assumed.
+
+Usage:
+
+    python scene_index.py
+    python scene_index.py --json
+"""
+
+import argparse
+import ast
+import json
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_RUN_TIME = 1.0
+DEFAULT_WAIT_TIME = 1.0
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _literal(node):
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return value if isinstance(value, (int, float)) else None
+
+
+def _keyword(call, name):
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+
+def _is_self_call(node, method):
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == method
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "self"
+    )
+
+
+class DurationEstimator:
+    def __init__(self, methods):
+        self.methods = methods
+        self.approximate = False
+        self._active = set()
+
+    def method(self, name):
+        if name in self._active:
+            # Recursive helpers cannot be unrolled statically
+            self.approximate = True
+            return 0.0
+        self._active.add(name)
+        try:
+            return self.block(self.methods[name].body)
+        finally:
+            self._active.discard(name)
+
+    def block(self, statements):
+        return sum(self.statement(stmt) for stmt in statements)
+
+    def statement(self, stmt):
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            return 0.0
+        if isinstance(stmt, ast.For):
+            return self.block(stmt.body) * self.iterations(stmt.iter)
+        if isinstance(stmt, ast.While):
+            self.approximate = True
+            return self.block(stmt.body)
+        if isinstance(stmt, ast.If):
+            body, orelse = self.block(stmt.body), self.block(stmt.orelse)
+            if body != orelse:
+                self.approximate = True
+            return max(body, orelse)
+        if isinstance(stmt, (ast.With, ast.Try)):
+            return sum(
+                self.block(getattr(stmt, field, []))
+                for field in ("body", "orelse", "finalbody")
+            )
+        return sum(self.call(node) for node in self.calls(stmt))
+
+    def calls(self, stmt):
+        # Calls in this statement, outermost first, not inside nested functions
+        todo = [stmt]
+        while todo:
+            node = todo.pop(0)
+            if isinstance(node, (ast.Lambda, ast.FunctionDef)):
+                continue
+            if isinstance(node, ast.Call):
+                yield node
+            todo.extend(ast.iter_child_nodes(node))
+
+    def iterations(self, node):
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            return len(node.elts)
+        if (
+            isinstance(node, ast.Call)
+            and _base_name(node.func) == "range"
+            and not node.keywords
+        ):
+            args = [_literal(arg) for arg in node.args]
+            if args and None not in args:
+                return len(range(*map(int, args)))
+        if isinstance(node, ast.Call) and _base_name(node.func) == "enumerate":
+            return self.iterations(node.args[0]) if node.args else 1
+        self.approximate = True
+        return 1
+
+    def run_time(self, node, default):
+        if node is None:
+            return default
+        value = _literal(node)
+        if value is None:
+            self.approximate = True
+            return default
+        return float(value)
+
+    def call(self, node):
+        if _is_self_call(node, "play"):
+            run_time = _keyword(node, "run_time")
+            if run_time is not None:
+                return self.run_time(run_time, DEFAULT_RUN_TIME)
+            # Without an explicit run_time, play lasts as long as its
+            # longest animation
+            inner = [
+                _keyword(arg, "run_time")
+                for arg in node.args
+                if isinstance(arg, ast.Call)
+            ]
+            times = [self.run_time(t, DEFAULT_RUN_TIME) for t in inner if t]
+            return max(times, default=DEFAULT_RUN_TIME)
+        if _is_self_call(node, "wait"):
+            duration = node.args[0] if node.args else _keyword(node, "duration")
+            return self.run_time(duration, DEFAULT_WAIT_TIME)
+        name = getattr(node.func, "attr", None)
+        if name in self.methods and _is_self_call(node, name):
+            return self.method(name)
+        return 0.0
+
+
+def scenes_in_file(path):
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    by_name = {node.name: node for node in classes}
+
+    scene_names = set()
+    for node in classes:
+        for base in map(_base_name, node.bases):
+            if base and (base.endswith("Scene") or base in scene_names):
+                scene_names.add(node.name)
+                break
+
+    scenes = []
+    for node in classes:
+        if node.name not in scene_names:
+            continue
+        # Methods from same-file base classes, overridden by the subclass
+        methods, chain = {}, [node]
+        while chain:
+            cls = chain.pop()
+            for base in map(_base_name, cls.bases):
+                if base in by_name:
+                    chain.append(by_name[base])
+            for item in cls.body:
+                if isinstance(item, ast.FunctionDef):
+                    methods.setdefault(item.name, item)
+        estimator = DurationEstimator(methods)
+        duration = estimator.method("construct") if "construct" in methods else 0.0
+        scenes.append(
+            {
+                "scene": node.name,
+                "path": Path(path),
+                "line": node.lineno,
+                "duration": round(duration, 2),
+                "approximate": estimator.approximate,
+            }
+        )
+    return scenes
+
+
+def index_scenes(scripts_dir=SCRIPTS_DIR):
+    scenes = []
+    for path in sorted(Path(scripts_dir).glob("*.py")):
+        if path.name.startswith("_"):
+            continue
+        scenes.extend(scenes_in_file(path))
+    return scenes
+
+
+def format_duration(scene):
+    return ("~" if scene["approximate"] else "") + f"{scene['duration']:.1f}s"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scripts-dir", default=str(SCRIPTS_DIR))
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args(argv)
+
+    scenes = index_scenes(args.scripts_dir)
+    if args.json:
+        print(
+            json.dumps(
+                [{**scene, "path": str(scene["path"])} for scene in scenes], indent=2
+            )
+        )
+        return 0
+
+    print(f"{'Scene':<34} {'Duration':>9}  File")
+    for scene in scenes:
+        location = f"{scene['path'].name}:{scene['line']}"
+        print(f"{scene['scene']:<34} {format_duration(scene):>9}  {location}")
+    total = sum(scene["duration"] for scene in scenes)
+    print(f"\n{len(scenes)} scenes, about {total:.0f}s of video")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""Render one long scene in parallel by splitting it into ranges of plays.
+
+A quick pass runs ``construct`` with every animation skipped to list the
+scene's ``play()``/``wait()`` calls and their run times. The calls are split
+into contiguous ranges of about equal length and each range is rendered in
+its own process: the plays before the range are fast-forwarded to their end
+state without drawing (manim's ``from_animation_number``), the plays after it
+are not run at all. The range movies are joined with ffmpeg's concat demuxer
+without re-encoding. Every process seeds ``random`` and NumPy from the scene
+name (as ``--deterministic`` does), so scenes that draw random values get the
+same ones in every shard and in the serial render.
+
+``--verify`` also renders the scene serially and compares the decoded frames
+of both movies (ffmpeg ``framemd5``). Fast-forwarding applies updaters once
+per skipped play instead of once per frame, so a scene whose state depends on
+frame-by-frame updaters can differ; the check reports the first frame where
+that happens.
+
+Usage:
+
+    python shard.py --scene LLMTrainingPipeline -q h -j 4
+    python shard.py --scene LLMTrainingPipeline -q l -j 4 --verify
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import (
+    QUALITY_FLAGS,
+    SCRIPTS_DIR,
+    discover_scenes,
+    load_script,
+    render_scene,
+)
+
+
+def list_plays(script, scene_name, quality, media_dir):
+    """Run time of every play()/wait() call of the scene, without drawing."""
+    from manim import tempconfig
+
+    from frame_hashes import seed_everything
+    from no_draw import NoDrawRenderer, no_output_config
+
+    class PlayListRenderer(NoDrawRenderer):
+        skip_all = True
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.run_times = []
+
+        def play(self, scene, *args, **kwargs):
+            super().play(scene, *args, **kwargs)
+            self.run_times.append(scene.duration)
+
+    # Seeded like the shard renders (see render_scene), so random run times
+    # come out the same
+    seed_everything(scene_name)
+    scene_cls = getattr(load_script(script), scene_name)
+    seed_everything(scene_name)
+    with tempconfig(no_output_config(quality=quality, media_dir=str(media_dir))):
+        scene = scene_cls(renderer=PlayListRenderer())
+        scene.render()
+    return scene.renderer.run_times
+
+
+def split_plays(run_times, shards):
+    """Contiguous (start, end) play ranges of roughly equal duration."""
+    total = sum(run_times)
+    bounds, elapsed = [0], 0.0
+    for index, run_time in enumerate(run_times[:-1]):
+        elapsed += run_time
+        # Manim reads upto_animation_number=0 as "no limit", so the first
+        # range has at least two plays
+        if elapsed >= total * len(bounds) / shards and index + 1 >= 2:
+            bounds.append(index + 1)
+            if len(bounds) == shards:
+                break
+    bounds.append(len(run_times))
+    return [
+        (start, None if end == len(run_times) else end)
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def stitch(movies, output):
+    """Join movies with identical encoding settings without re-encoding."""
+    from manim import config
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for movie in movies:
+            escaped = str(Path(movie).resolve()).replace("'", r"'\''")
+            listing.write(f"file '{escaped}'\n")
+    try:
+        subprocess.run(
+            [
+                config.ffmpeg_executable,
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                listing.name,
+                "-c",
+                "copy",
+                str(output),
+            ],
+            check=True,
+        )
+    finally:
+        Path(listing.name).unlink()
+    return Path(output)
+
+
+def frame_digests(movie):
+    """MD5 of every decoded video frame."""
+    from manim import config
+
+    lines = subprocess.run(
+        [
+            config.ffmpeg_executable,
+            "-loglevel",
+            "error",
+            "-i",
+            str(movie),
+            "-map",
+            "0:v",
+            "-f",
+            "framemd5",
+            "-",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.splitlines()
+    return [line.split(",")[-1].strip() for line in lines if not line.startswith("#")]
+
+
+def compare_frames(a, b):
+    """(first differing frame or None, frames in a, frames in b)."""
+    digests_a, digests_b = frame_digests(a), frame_digests(b)
+    for index, (x, y) in enumerate(zip(digests_a, digests_b)):
+        if x != y:
+            return index, len(digests_a), len(digests_b)
+    if len(digests_a) != len(digests_b):
+        return min(len(digests_a), len(digests_b)), len(digests_a), len(digests_b)
+    return None, len(digests_a), len(digests_b)
+
+
+def render_sharded(script, scene_name, quality, media_dir, shards, verify=False):
+    result = {"scene": scene_name}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=shards) as pool:
+        run_times = pool.submit(
+            list_plays, script, scene_name, quality, media_dir
+        ).result()
+        ranges = split_plays(run_times, shards)
+        print(
+            f"{scene_name}: {len(run_times)} plays, {sum(run_times):.1f}s "
+            f"in {len(ranges)} shards: {ranges}",
+            flush=True,
+        )
+        futures = [
+            pool.submit(
+                render_scene,
+                script,
+                scene_name,
+                quality,
+                media_dir,
+                {"play_range": play_range},
+            )
+            for play_range in ranges
+        ]
+        shard_results = [future.result() for future in futures]
+    for shard in shard_results:
+        if "error" in shard:
+            result["error"] = shard["error"]
+            return result
+
+    movies = [shard["output"] for shard in shard_results]
+    output = Path(movies[0]).with_name(f"{scene_name}_sharded{Path(movies[0]).suffix}")
+    result["output"] = str(stitch(movies, output))
+    result["shards"] = [
+        {"plays": list(play_range), "seconds": shard["seconds"]}
+        for play_range, shard in zip(ranges, shard_results)
+    ]
+    result["seconds"] = round(time.perf_counter() - start, 2)
+
+    if verify:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            serial = pool.submit(
+                render_scene,
+                script,
+                scene_name,
+                quality,
+                media_dir,
+                {"play_range": (0, None)},
+            ).result()
+        if "error" in serial:
+            result["error"] = serial["error"]
+            return result
+        result["serial_output"] = serial["output"]
+        result["serial_seconds"] = serial["seconds"]
+        first, sharded_frames, serial_frames = compare_frames(
+            result["output"], serial["output"]
+        )
+        result["frames"] = sharded_frames
+        result["identical"] = first is None
+        if first is not None:
+            result["first_difference"] = first
+            result["serial_frames"] = serial_frames
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scene", required=True)
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="h")
+    parser.add_argument("-j", "--shards", type=int, default=4, help="processes")
+    parser.add_argument("--media-dir", default=str(SCRIPTS_DIR / "media"))
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="also render serially and check that the frames are identical",
+    )
+    args = parser.parse_args(argv)
+
+    scripts = [path for path, name in discover_scenes() if name == args.scene]
+    if not scripts:
+        parser.error(f"no scene named {args.scene}")
+
+    result = render_sharded(
+        scripts[0],
+        args.scene,
+        QUALITY_FLAGS[args.quality],
+        args.media_dir,
+        max(1, args.shards),
+        args.verify,
+    )
+    if "error" in result:
+        print(f"{args.scene} failed:\n{result['error']}")
+        return 1
+    for shard in result["shards"]:
+        print(f"  plays {shard['plays']}: {shard['seconds']:.2f}s")
+    print(f"{result['output']} ({result['seconds']:.2f}s)")
+    if args.verify:
+        print(f"Serial render: {result['serial_seconds']:.2f}s")
+        if result["identical"]:
+            print(f"All {result['frames']} frames are identical")
+        else:
+            print(
+                f"Frames differ from frame {result['first_difference']} "
+                f"({result['frames']} sharded, {result['serial_frames']} serial)"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Composite unchanging mobjects from cached layers instead of redrawing them.
+
+Manim already caches a static background per ``play()``, but only for the
+mobjects drawn *before* the first moving one: everything after it in drawing
+order is redrawn on every frame, because it has to end up on top. In scenes
+like ``MultiHeadAttention`` that is most of the frame, e.g. titles and labels
+added after the boxes that later animate.
+
+``StaticLayerRenderer`` splits the draw list of each ``play()`` into runs of
+moving mobjects (those the animations, updaters or the foreground touch) and
+runs of static ones. Each static run is rasterized once onto a transparent
+layer, cropped to what it covers. Per frame only the moving runs are drawn;
+the static runs in between are alpha-composited from their layers, so the
+drawing order and thus the picture stays the same.
+
+Like manim's own static background, this assumes mobjects outside the
+animations are not changed during the ``play()`` by someone else's updater.
+"""
+
+import numpy as np
+from manim import logger
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+
+def moving_ids(scene):
+    roots = [
+        anim.mobject for anim in scene.animations or [] if anim.mobject is not None
+    ]
+    roots += scene.foreground_mobjects
+    roots += [mob for mob in scene.get_mobject_family_members() if mob.updaters]
+    return {id(mob) for root in roots for mob in root.get_family()}
+
+
+def split_runs(mobjects, moving):
+    """[(static, [mobjects])] runs of consecutive static / moving mobjects."""
+    runs = []
+    for mob in mobjects:
+        static = id(mob) not in moving
+        if runs and runs[-1][0] == static:
+            runs[-1][1].append(mob)
+        else:
+            runs.append((static, [mob]))
+    return runs
+
+
+def crop_layer(layer):
+    """(rows, cols, pixels) of the part of an RGBA layer that is not empty."""
+    alpha = layer[:, :, 3]
+    rows, cols = np.flatnonzero(alpha.any(axis=1)), np.flatnonzero(alpha.any(axis=0))
+    if not len(rows):
+        return None
+    rows = slice(rows[0], rows[-1] + 1)
+    cols = slice(cols[0], cols[-1] + 1)
+    return rows, cols, layer[rows, cols].copy()
+
+
+def composite(frame, layer):
+    """Draw a cropped, premultiplied RGBA layer over ``frame`` in place."""
+    rows, cols, pixels = layer
+    max_val = np.iinfo(pixels.dtype).max
+    target = frame[rows, cols].astype(np.uint32)
+    alpha = pixels[:, :, 3:].astype(np.uint32)
+    # Cairo's OVER operator on premultiplied colors
+    frame[rows, cols] = pixels + (target * (max_val - alpha) + max_val // 2) // max_val
+
+
+class StaticLayerRenderer(CairoRenderer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layers = None
+        self.moving = set()
+        self.bottom_key = None
+        self.drawn = 0
+        self.composited = 0
+
+    def draw_list(self, scene):
+        return extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            use_z_index=self.camera.use_z_index,
+            only_those_with_points=True,
+        )
+
+    def rasterize(self, mobjects, transparent=False):
+        camera = self.camera
+        if transparent:
+            camera.set_pixel_array(np.zeros_like(camera.pixel_array))
+        else:
+            camera.reset()
+        camera.capture_mobjects(mobjects, include_submobjects=False)
+        return camera.pixel_array.copy()
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.layers = None
+        if self.skip_animations or scene.is_current_animation_frozen_frame():
+            return super().save_static_frame_data(scene, static_mobjects)
+
+        self.static_image = None
+        self.bottom_key = None
+        self.layers = {}
+        self.moving = moving_ids(scene)
+        for i, (static, run) in enumerate(
+            split_runs(self.draw_list(scene), self.moving)
+        ):
+            if not static:
+                continue
+            key = tuple(map(id, run))
+            if i == 0:
+                # Below everything that moves: the frame starts from it
+                self.bottom_key = key
+                self.static_image = self.rasterize(run)
+            else:
+                self.layers[key] = crop_layer(self.rasterize(run, transparent=True))
+        return self.static_image
+
+    def render(self, scene, time, moving_mobjects):
+        if self.layers is None:
+            return super().render(scene, time, moving_mobjects)
+        camera = self.camera
+        runs = split_runs(self.draw_list(scene), self.moving)
+        if runs and runs[0][0] and tuple(map(id, runs[0][1])) == self.bottom_key:
+            camera.set_frame_to_background(self.static_image)
+            self.composited += len(runs.pop(0)[1])
+        else:
+            camera.reset()
+        for static, run in runs:
+            key = tuple(map(id, run))
+            if static and key in self.layers:
+                if self.layers[key] is not None:
+                    composite(camera.pixel_array, self.layers[key])
+                self.composited += len(run)
+            else:
+                # Moving, or static but added to the scene mid-play
+                camera.capture_mobjects(run, include_submobjects=False)
+                self.drawn += len(run)
+        self.add_frame(self.get_frame())
+
+    def layer_stats(self):
+        total = self.drawn + self.composited
+        return {
+            "draws": self.drawn,
+            "composited": self.composited,
+            "composited_pct": round(100 * self.composited / total, 1) if total else 0.0,
+        }
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        logger.info(
+            "%s: drew %d mobjects, composited %d from static layers",
+            type(scene).__name__,
+            self.drawn,
+            self.composited,
+        )
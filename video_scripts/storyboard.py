@@ -0,0 +1,112 @@
+"""Storyboard mode: one keyframe PNG per play() instead of a video.
+
+The scene's ``construct`` runs as usual, but every animation is skipped to
+its end state (manim's own ``skip_animations`` path), nothing is encoded, and
+the final frame of each ``play()`` is saved as an image. An ``index.html``
+contact sheet lists the keyframes with their animations and source lines, so
+layouts can be reviewed without rendering the video.
+
+Usage:
+
+    python render_all.py -ql --storyboard storyboards/ --scene AttentionMechanism
+"""
+
+import html
+from pathlib import Path
+
+from manim import Wait
+
+from no_draw import NoDrawRenderer
+from play_profiler import scene_stack
+
+
+class StoryboardRenderer(NoDrawRenderer):
+    storyboard_dir = "storyboards"
+    skip_all = True
+
+    def __init__(self, *args, storyboard_dir=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if storyboard_dir is not None:
+            self.storyboard_dir = storyboard_dir
+        self.keyframes = []
+        self.output_path = None
+
+    def play(self, scene, *args, **kwargs):
+        stack = scene_stack(scene)
+        start_time = self.time
+        super().play(scene, *args, **kwargs)
+
+        animations = scene.animations or []
+        if len(animations) == 1 and isinstance(animations[0], Wait):
+            # Holds don't change the picture; fold them into the last keyframe
+            if self.keyframes:
+                self.keyframes[-1]["hold"] += self.time - start_time
+            return
+
+        out_dir = Path(self.storyboard_dir) / type(scene).__name__
+        out_dir.mkdir(parents=True, exist_ok=True)
+        image_name = f"{len(self.keyframes):03}.png"
+        self.update_frame(scene)
+        self.camera.get_image().save(out_dir / image_name)
+        self.keyframes.append(
+            {
+                "image": image_name,
+                "animations": [type(anim).__name__ for anim in animations],
+                "source": f"{stack[-1][0]}:{stack[-1][2]}" if stack else "",
+                "start": start_time,
+                "end": self.time,
+                "hold": 0.0,
+            }
+        )
+
+    # Only the end state of each play is rasterized: NoDrawRenderer skips
+    # the static layer, the intermediate frames and the held frames
+    def update_frame(self, *args, **kwargs):
+        super(NoDrawRenderer, self).update_frame(*args, **kwargs)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        self.output_path = self.write_index(type(scene).__name__)
+
+    def write_index(self, scene_name):
+        out_dir = Path(self.storyboard_dir) / scene_name
+        out_dir.mkdir(parents=True, exist_ok=True)
+        cards = []
+        for i, frame in enumerate(self.keyframes):
+            caption = (
+                f"#{i} &middot; {frame['start']:.1f}s&ndash;{frame['end']:.1f}s"
+                + (f" + {frame['hold']:.1f}s hold" if frame["hold"] else "")
+            )
+            cards.append(
+                "<figure>"
+                f'<a href="{frame["image"]}"><img src="{frame["image"]}"></a>'
+                f"<figcaption><b>{caption}</b><br>"
+                f"{html.escape(', '.join(frame['animations']))}<br>"
+                f"<code>{html.escape(frame['source'])}</code></figcaption>"
+                "</figure>"
+            )
+        page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(scene_name)} storyboard</title>
+<style>
+body {{ background: #111; color: #ddd; font-family: sans-serif; }}
+main {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr)); gap: 16px; }}
+figure {{ margin: 0; }}
+img {{ width: 100%; border: 1px solid #333; }}
+figcaption {{ font-size: 13px; padding-top: 4px; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(scene_name)}</h1>
+<p>{len(self.keyframes)} keyframes, {self.time:.1f}s total</p>
+<main>
+{chr(10).join(cards)}
+</main>
+</body>
+</html>
+"""
+        index = out_dir / "index.html"
+        index.write_text(page, encoding="utf-8")
+        return index
@@ -0,0 +1,208 @@
+"""Process-wide and on-disk cache of Text/MathTex geometry.
+
+Every scene builds dozens of ``Text`` objects with the same strings and font
+sizes, and each one goes through SVG parsing and curve closing again. The
+``Text``, ``MathTex`` and ``Tex`` subclasses here build a string once, keep
+the result in an in-memory LRU and pickle it to disk, and hand out copies
+afterwards. Colour is applied to the copy, so the same string in different
+colours shares one entry. They subclass manim's classes, so ``isinstance``
+checks and subclasses in scripts keep working.
+
+Use it in a script with ``text_cache.install(globals())`` or pass
+``--text-cache`` to render_all.py, which installs it into every scene module.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import manim
+from manim import MathTex as _MathTex
+from manim import Tex as _Tex
+from manim import Text as _Text
+from manim import __version__, config
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".text_cache"
+
+# Arguments that colour parts of the string; these must be part of the key
+# because the colour cannot be applied uniformly to the copy afterwards.
+_PARTIAL_COLOR_ARGS = {
+    "t2c",
+    "t2g",
+    "text2color",
+    "text2gradient",
+    "gradient",
+    "tex_to_color_map",
+    "substrings_to_isolate",
+}
+
+
+def template_text(template):
+    if template is None:
+        return ""
+    return "|".join(
+        str(getattr(template, name, ""))
+        for name in ("tex_compiler", "output_format", "body")
+    )
+
+
+class GeometryCache:
+    def __init__(self, max_entries=2048, cache_dir=DEFAULT_CACHE_DIR, max_files=20000):
+        self.max_entries = max_entries
+        self.max_files = max_files
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _key(self, cls, args, kwargs):
+        kwargs = dict(kwargs)
+        template = kwargs.pop("tex_template", None)
+        if template is None and issubclass(cls, _MathTex):
+            template = config.tex_template
+        parts = [
+            __version__,
+            str(config.renderer),
+            f"{cls.__module__}.{cls.__qualname__}",
+            repr(args),
+            repr(sorted(kwargs.items())),
+            # A template's repr holds its address; its LaTeX is what counts
+            template_text(template),
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def build(self, cls, args, kwargs, construct=None):
+        kwargs = dict(kwargs)
+        color = None
+        if not _PARTIAL_COLOR_ARGS & kwargs.keys():
+            color = kwargs.pop("color", None)
+        key = self._key(cls, args, kwargs)
+
+        mob = self._memory.get(key)
+        if mob is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+        else:
+            mob = self._load(key)
+            if mob is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                mob = (construct or cls)(*args, **kwargs)
+                self._dump(key, mob)
+            self._memory[key] = mob
+            if len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+        result = mob.copy()
+        if color is not None:
+            result.set_color(color)
+        return result
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.pickle"
+
+    def _load(self, key):
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                mob = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        os.utime(path)
+        return mob
+
+    def _dump(self, key, mob):
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                pickle.dump(mob, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            tmp_path.unlink(missing_ok=True)
+            return
+        # Rename so concurrent render workers never read a half-written file
+        tmp_path.replace(path)
+        if self.misses % 256 == 0:
+            self._evict_files()
+
+    def _evict_files(self):
+        files = sorted(
+            self.cache_dir.glob("*/*.pickle"), key=lambda p: p.stat().st_mtime
+        )
+        for path in files[: max(0, len(files) - self.max_files)]:
+            path.unlink(missing_ok=True)
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        hit_rate = (self.hits + self.disk_hits) / lookups if lookups else 0.0
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._memory),
+            "hit_rate": round(hit_rate, 3),
+        }
+
+    def clear(self):
+        self._memory.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+
+default_cache = GeometryCache()
+
+
+class CachedConstruction(type(_Text)):
+    """Metaclass that builds the cached classes through ``default_cache``."""
+
+    def __call__(cls, *args, **kwargs):
+        # Subclasses defined in scripts may do anything in __init__
+        if cls not in CACHED_CLASSES:
+            return super().__call__(*args, **kwargs)
+        return default_cache.build(cls, args, kwargs, super().__call__)
+
+
+class Text(_Text, metaclass=CachedConstruction):
+    pass
+
+
+class MathTex(_MathTex, metaclass=CachedConstruction):
+    pass
+
+
+class Tex(_Tex, metaclass=CachedConstruction):
+    pass
+
+
+CACHED_CLASSES = (Text, MathTex, Tex)
+
+
+def install(namespace=None):
+    """Build Text/MathTex/Tex through the cache from now on.
+
+    Patches ``manim`` itself, for modules that import it later, every module
+    already imported that holds manim's classes (a script's helper modules),
+    and ``namespace``, a module or a ``globals()`` dict.
+    """
+    originals = {cls.__name__: cls.__bases__[0] for cls in CACHED_CLASSES}
+    namespaces = [vars(manim)]
+    namespaces += [
+        vars(module)
+        for name, module in list(sys.modules.items())
+        if module is not None and name.split(".")[0] != "manim"
+    ]
+    if namespace is not None:
+        namespaces.append(namespace if isinstance(namespace, dict) else vars(namespace))
+    for names in namespaces:
+        for cls in CACHED_CLASSES:
+            if names.get(cls.__name__) is originals[cls.__name__]:
+                names[cls.__name__] = cls
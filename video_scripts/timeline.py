@@ -0,0 +1,298 @@
+"""Compile a scene into a timeline file and replay it without the scene code.
+
+``TimelineRecorder`` runs ``construct`` once, advancing every animation frame
+by frame as usual, but rasterizes nothing. Instead it records, per frame, the
+draw list: the points and style of every visible family member. Identical
+states are stored once, so a title that stays put for a minute costs one
+entry, and consecutive identical frames (``self.wait()`` holds) are
+run-length encoded. Each ``play()`` is listed with its animations, run time
+and rate functions.
+
+``replay`` rebuilds plain VMobjects / ImageMobjects / PMobjects from the file
+and rasterizes them with a camera at any quality, optionally for a time range
+only, without importing or running the scene script.
+
+Usage:
+
+    python render_all.py --export-timeline timelines/ --scene AttentionMechanism
+    python timeline.py timelines/AttentionMechanism.npz -q h
+    python timeline.py timelines/AttentionMechanism.npz -q k --start 30 --end 60
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import ImageMobject, PMobject, VMobject
+from manim.camera.camera import Camera
+from manim.constants import CapStyleType, LineJointType
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+from no_draw import NoDrawRenderer
+
+VERSION = 1
+
+
+def snapshot(mob):
+    """(kind, arrays, metadata) describing how the camera draws ``mob``."""
+    if isinstance(mob, VMobject):
+        arrays = {
+            "points": mob.points,
+            "fill_rgbas": mob.get_fill_rgbas(),
+            "stroke_rgbas": mob.get_stroke_rgbas(),
+            "background_stroke_rgbas": mob.get_stroke_rgbas(background=True),
+        }
+        meta = {
+            "stroke_width": float(mob.get_stroke_width()),
+            "background_stroke_width": float(mob.get_stroke_width(background=True)),
+            "sheen_direction": [float(x) for x in mob.get_sheen_direction()],
+            "joint_type": mob.joint_type.name,
+            "cap_style": mob.cap_style.name,
+        }
+        return "vmobject", arrays, meta
+    if isinstance(mob, PMobject):
+        arrays = {"points": mob.points, "rgbas": mob.rgbas}
+        return "pmobject", arrays, {"stroke_width": float(mob.stroke_width)}
+    if isinstance(mob, AbstractImageMobject):
+        arrays = {"points": mob.points, "pixel_array": mob.get_pixel_array()}
+        meta = {"resampling_algorithm": int(mob.resampling_algorithm)}
+        return "image", arrays, meta
+    return None
+
+
+class TimelineRecorder(NoDrawRenderer):
+    timeline_dir = "timelines"
+
+    def __init__(self, *args, timeline_dir=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if timeline_dir is not None:
+            self.timeline_dir = timeline_dir
+        self.state_ids = {}
+        self.states = []
+        self.arrays = {}
+        self.frames = []
+        self.frame_count = 0
+        self.plays = []
+        self.output_path = None
+
+    def state_id(self, mob):
+        snap = snapshot(mob)
+        if snap is None:
+            return None
+        kind, arrays, meta = snap
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(kind.encode())
+        digest.update(json.dumps(meta, sort_keys=True).encode())
+        for name in sorted(arrays):
+            array = np.ascontiguousarray(arrays[name])
+            digest.update(name.encode())
+            digest.update(str(array.shape).encode())
+            digest.update(array.tobytes())
+        key = digest.digest()
+        if key not in self.state_ids:
+            index = len(self.states)
+            self.state_ids[key] = index
+            self.states.append({"kind": kind, **meta})
+            for name, array in arrays.items():
+                self.arrays[f"s{index}.{name}"] = np.array(array)
+        return self.state_ids[key]
+
+    def record_frames(self, scene, count=1):
+        if self.skip_animations or count <= 0:
+            return
+        mobjects = extract_mobject_family_members(
+            list_update(scene.mobjects, scene.foreground_mobjects),
+            use_z_index=self.camera.use_z_index,
+            only_those_with_points=True,
+        )
+        ids = [i for i in map(self.state_id, mobjects) if i is not None]
+        if self.frames and self.frames[-1][1] == ids:
+            self.frames[-1][0] += count
+        else:
+            self.frames.append([count, ids])
+        self.frame_count += count
+        self.advance(count)
+
+    def play(self, scene, *args, **kwargs):
+        start_frame = self.frame_count
+        super().play(scene, *args, **kwargs)
+        animations = scene.animations or []
+        self.plays.append(
+            {
+                "start_frame": start_frame,
+                "frames": self.frame_count - start_frame,
+                "run_time": float(getattr(scene, "duration", 0.0)),
+                "animations": [type(anim).__name__ for anim in animations],
+                "rate_funcs": [
+                    getattr(anim.rate_func, "__name__", "custom") for anim in animations
+                ],
+            }
+        )
+
+    # Frames are recorded instead of drawn
+    def render(self, scene, time, moving_mobjects):
+        self.record_frames(scene)
+
+    def freeze_current_frame(self, duration):
+        self.record_frames(self._scene, int(duration * self.camera.frame_rate))
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self._scene = scene
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        self.output_path = self.write(type(scene).__name__)
+
+    def write(self, scene_name):
+        camera = self.camera
+        header = {
+            "version": VERSION,
+            "scene": scene_name,
+            "frame_rate": camera.frame_rate,
+            "background_color": camera.background_color.to_hex(),
+            "frame_width": camera.frame_width,
+            "frame_height": camera.frame_height,
+            "frame_center": [float(x) for x in camera.frame_center],
+            "states": self.states,
+            "frames": self.frames,
+            "plays": self.plays,
+        }
+        out_dir = Path(self.timeline_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"{scene_name}.npz"
+        np.savez_compressed(path, header=np.array(json.dumps(header)), **self.arrays)
+        return path
+
+
+def load(path):
+    data = np.load(path)
+    return json.loads(str(data["header"])), data
+
+
+def build(index, state, data):
+    kind = state["kind"]
+    prefix = f"s{index}."
+    if kind == "vmobject":
+        mob = VMobject()
+        mob.points = data[prefix + "points"]
+        mob.fill_rgbas = data[prefix + "fill_rgbas"]
+        mob.stroke_rgbas = data[prefix + "stroke_rgbas"]
+        mob.background_stroke_rgbas = data[prefix + "background_stroke_rgbas"]
+        mob.stroke_width = state["stroke_width"]
+        mob.background_stroke_width = state["background_stroke_width"]
+        mob.sheen_direction = np.array(state["sheen_direction"])
+        mob.joint_type = LineJointType[state["joint_type"]]
+        mob.cap_style = CapStyleType[state["cap_style"]]
+    elif kind == "pmobject":
+        mob = PMobject(stroke_width=state["stroke_width"])
+        mob.points = data[prefix + "points"]
+        mob.rgbas = data[prefix + "rgbas"]
+    else:
+        mob = ImageMobject(data[prefix + "pixel_array"])
+        mob.points = data[prefix + "points"]
+        mob.set_resampling_algorithm(state["resampling_algorithm"])
+    return mob
+
+
+def replay(path, quality="high_quality", output=None, start=None, end=None):
+    """Rasterize a recorded timeline at ``quality``, from ``start`` to ``end`` s."""
+    from manim import config, tempconfig
+
+    from frame_stream import encoder_command
+
+    header, data = load(path)
+    source_fps = header["frame_rate"]
+    # Source frame index at which each run-length encoded entry starts
+    starts, total = [], 0
+    for count, _ in header["frames"]:
+        starts.append(total)
+        total += count
+    if not total:
+        raise ValueError(f"{path} has no frames")
+
+    overrides = {
+        "quality": quality,
+        "frame_width": header["frame_width"],
+        "frame_height": header["frame_height"],
+        "background_color": header["background_color"],
+    }
+    with tempconfig(overrides):
+        fps = config["frame_rate"]
+        start = start or 0.0
+        duration = total / source_fps
+        end = duration if end is None else min(end, duration)
+        first, last = math.ceil(start * fps), math.ceil(end * fps)
+        if output is None:
+            suffix = f"_{start:g}-{end:g}" if start > 0 or end < duration else ""
+            output = Path(path).with_name(
+                f"{header['scene']}_{config['pixel_height']}p{fps:g}{suffix}.mp4"
+            )
+        camera = Camera(frame_center=np.array(header["frame_center"]))
+        mobjects = {}
+        process = subprocess.Popen(encoder_command(output), stdin=subprocess.PIPE)
+        previous, frame = None, None
+        try:
+            for k in range(first, last):
+                source = min(total - 1, int(round(k * source_fps / fps, 6)))
+                entry = bisect.bisect_right(starts, source) - 1
+                if entry != previous:
+                    ids = header["frames"][entry][1]
+                    # Keep only this frame's states, so memory stays bounded
+                    # by one frame rather than the whole timeline
+                    mobjects = {
+                        i: (
+                            mobjects[i]
+                            if i in mobjects
+                            else build(i, header["states"][i], data)
+                        )
+                        for i in ids
+                    }
+                    camera.reset()
+                    camera.capture_mobjects(
+                        [mobjects[i] for i in ids], include_submobjects=False
+                    )
+                    frame = camera.pixel_array.tobytes()
+                    previous = entry
+                process.stdin.write(frame)
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            process.wait()
+        if process.returncode:
+            raise RuntimeError(
+                f"ffmpeg exited with code {process.returncode} while encoding {output}"
+            )
+    return Path(output)
+
+
+def main(argv=None):
+    from render_all import QUALITY_FLAGS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("timeline", help="a .npz file written by --export-timeline")
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="h")
+    parser.add_argument("--start", type=float, help="start time in seconds")
+    parser.add_argument("--end", type=float, help="end time in seconds")
+    parser.add_argument("-o", "--output", help="output movie path")
+    args = parser.parse_args(argv)
+
+    output = replay(
+        args.timeline, QUALITY_FLAGS[args.quality], args.output, args.start, args.end
+    )
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
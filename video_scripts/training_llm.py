@@ -1,6 +1,8 @@
 import numpy as np
 from manim import *
 
+from edge_bundle import EdgeBundle
+
 
 class LLMTrainingPipeline(Scene):
     def construct(self):
@@ -30,19 +32,8 @@ class LLMTrainingPipeline(Scene):
             network.arrange(RIGHT, buff=1)
             network.scale(scale)
 
-            # Add stylized connections using ArcBetweenPoints
-            connections = VGroup()
-            for i in range(len(layers) - 1):
-                curr_layer = layers[i]
-                next_layer = layers[i + 1]
-                for curr_node in curr_layer:
-                    for next_node in next_layer:
-                        line = ArcBetweenPoints(
-                            curr_node.get_center(),
-                            next_node.get_center(),
-                            angle=0.1,
-                        ).set_stroke(opacity=0.2)
-                        connections.add(line)
+            # Add stylized arc connections as one batched edge bundle
+            connections = EdgeBundle.between_layers(layers, angle=0.1, opacity=0.2)
 
             network.add_to_back(connections)
             return network
@@ -184,7 +175,11 @@ class LLMTrainingPipeline(Scene):
         pulses = []
         for layer in network[:-1]:
             pulse = Dot(color=BLUE, radius=0.2)
-            pulse.move_to(layer[2])
+            if isinstance(layer, EdgeBundle):
+                # The connections: the third arc, as with the old VGroup
+                pulse.move_to(layer.get_edge_center(2))
+            else:
+                pulse.move_to(layer[2])
             pulse.set_opacity(0.8)
             pulses.append(pulse)
 
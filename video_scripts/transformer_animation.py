@@ -1,19 +1,21 @@
 import numpy as np
 from manim import *
 
+from heatmap import Heatmap
+
 
 class EnhancedWordEmbeddingAnimation(Scene):
-    def create_embedding_vector(self, values, color, height=0.4, width=0.8):
-        vector = VGroup()
-        for i, val in enumerate(values):
-            cell = Rectangle(height=height, width=width, stroke_width=1)
-            text = DecimalNumber(val, num_decimal_places=2, font_size=16)
-            text.move_to(cell)
-            group = VGroup(cell, text)
-            group.set_color(color)
-            vector.add(group)
-        vector.arrange(DOWN, buff=0.1)
-        return vector
+    def create_embedding_vector(self, values, color, height=3.9, width=0.8):
+        # One image for the whole vector, so d=512 costs as much as d=8
+        limit = np.abs(values).max()
+        return Heatmap(
+            values,
+            height=height,
+            width=width,
+            colors=[BLACK, color, WHITE],
+            vmin=-limit,
+            vmax=limit,
+        )
 
     def create_annotation(self, text, color, font_size=20):
         return Text(text, color=color, font_size=font_size)
@@ -81,9 +83,12 @@ class EnhancedWordEmbeddingAnimation(Scene):
         )
         self.play(first_word.animate.set_color(WORD_COLOR))
 
-        # Create embedding vectors (showing more dimensions)
-        embedding_values = np.random.randn(8) * 0.5
-        pos_values = np.sin(np.linspace(0, 1, 8)) * 0.3
+        # Create embedding vectors with the full d = 512 dimensions
+        d = 512
+        embedding_values = np.random.randn(d) * 0.5
+        # Sinusoidal positional encoding of position 1, as in the formula below
+        angles = 1 / 10000 ** (2 * (np.arange(d) // 2) / d)
+        pos_values = np.where(np.arange(d) % 2 == 0, np.sin(angles), np.cos(angles))
         final_values = embedding_values + pos_values
 
         # Create vectors with labels
@@ -92,7 +97,7 @@ class EnhancedWordEmbeddingAnimation(Scene):
         final_vector = self.create_embedding_vector(final_values, FINAL_COLOR)
 
         # Arrange vectors
-        vectors_group = VGroup(embedding_vector, pos_vector, final_vector)
+        vectors_group = Group(embedding_vector, pos_vector, final_vector)
         vectors_group.arrange(RIGHT, buff=1.5)
         vectors_group.next_to(token_process, DOWN, buff=1.5)
 
@@ -115,7 +120,7 @@ class EnhancedWordEmbeddingAnimation(Scene):
 
         # Show vectors and formula
         self.play(
-            *[Create(vector) for vector in vectors_group],
+            *[FadeIn(vector) for vector in vectors_group],
             *[Write(label) for label in labels],
             Write(pos_formula),
         )
@@ -147,20 +152,11 @@ class EnhancedWordEmbeddingAnimation(Scene):
 
         self.play(Write(plus), Write(equals))
 
-        # Highlight addition process
-        for i in range(len(embedding_values)):
-            self.play(
-                embedding_vector[i].animate.set_color(YELLOW),
-                pos_vector[i].animate.set_color(YELLOW),
-                final_vector[i].animate.set_color(YELLOW),
-                run_time=0.3,
-            )
-            self.play(
-                embedding_vector[i].animate.set_color(EMBED_COLOR),
-                pos_vector[i].animate.set_color(POS_COLOR),
-                final_vector[i].animate.set_color(FINAL_COLOR),
-                run_time=0.3,
-            )
+        # Highlight addition process, sweeping all dimensions in one play
+        self.play(
+            *[vector.sweep(rate_func=linear) for vector in vectors_group],
+            run_time=4.8,
+        )
 
         # Final summary box
         summary_text = """
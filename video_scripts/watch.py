@@ -0,0 +1,128 @@
+"""Re-render scenes as their code changes.
+
+Watches the scripts in video_scripts/ and, whenever one is saved, compares
+the fingerprint of every scene (its class, the script's module-level code and
+the local modules it imports; see render_cache) with the previous one. Only
+scenes whose fingerprint changed are rendered, so editing
+``MultiHeadAttention`` leaves ``AttentionMechanism`` alone.
+
+The watcher warms up manim once (see render_server) and forks a worker per
+render. Manim's partial-movie cache stays on, so plays before the first
+changed one reuse their existing segments and only the rest is encoded.
+
+Usage:
+
+    python watch.py -ql
+    python watch.py -ql --scene MultiHeadAttention --scene AttentionMechanism
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from render_all import QUALITY_FLAGS, SCRIPTS_DIR, print_report, render_all
+from render_cache import DEFAULT_CACHE_DIR, RenderCache, scene_fingerprint
+from render_server import fork_renders, warm_up
+from scene_index import scenes_in_file
+
+
+def snapshot(scripts_dir):
+    return {
+        path: path.stat().st_mtime_ns
+        for path in Path(scripts_dir).glob("*.py")
+        if not path.name.startswith("_")
+    }
+
+
+def fingerprints(scripts_dir, only=None, previous=None):
+    previous = previous or {}
+    prints = {}
+    for path in sorted(Path(scripts_dir).glob("*.py")):
+        if path.name.startswith("_"):
+            continue
+        try:
+            scenes = scenes_in_file(path)
+            keys = {
+                scene["scene"]: scene_fingerprint(path, scene["scene"])
+                for scene in scenes
+                if not only or scene["scene"] in only
+            }
+        except SyntaxError:
+            # Mid-edit; keep the old fingerprints until the file parses again
+            keys = {
+                name: key
+                for name, (old_path, key) in previous.items()
+                if old_path == path
+            }
+        for name, key in keys.items():
+            prints[name] = (path, key)
+    return prints
+
+
+def watch(scripts_dir, quality, media_dir, cache, only=None, interval=0.5):
+    mtimes = snapshot(scripts_dir)
+    known = fingerprints(scripts_dir, only)
+    print(f"Watching {len(known)} scenes in {scripts_dir}", flush=True)
+    while True:
+        time.sleep(interval)
+        current = snapshot(scripts_dir)
+        if current == mtimes:
+            continue
+        mtimes = current
+
+        latest = fingerprints(scripts_dir, only, known)
+        changed = [
+            (path, name)
+            for name, (path, key) in latest.items()
+            if known.get(name, (None, None))[1] != key
+        ]
+        known.update(latest)
+        if not changed:
+            print("No scene changed", flush=True)
+            continue
+        print("Changed: " + ", ".join(name for _, name in changed), flush=True)
+        # Forked from this thread: forking from pool threads can deadlock
+        report = render_all(
+            changed,
+            quality,
+            media_dir,
+            os.cpu_count(),
+            cache,
+            render_many=fork_renders,
+        )
+        print_report(report)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    parser.add_argument("--scene", action="append", help="only watch these scenes")
+    parser.add_argument("--media-dir", default=str(SCRIPTS_DIR / "media"))
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR))
+    parser.add_argument(
+        "--interval", type=float, default=0.5, help="seconds between checks"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    warm_up(args.media_dir)
+    print(f"Warmed up in {time.perf_counter() - start:.1f}s")
+    cache = RenderCache(args.cache_dir)
+    try:
+        watch(
+            SCRIPTS_DIR,
+            QUALITY_FLAGS[args.quality],
+            args.media_dir,
+            cache,
+            args.scene,
+            args.interval,
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())